@@ -7,6 +7,8 @@ class CitiesDatabase:
     
     def __init__(self):
         self._cities: Optional[Dict[str, Dict[str, Any]]] = None
+        # Lookups are pure over static data, so each (city, state, country) is resolved once
+        self._lookup_cache: Dict[tuple, Optional[Dict[str, Any]]] = {}
     
     def _load_cities(self):
         """Load cities data from JSON file"""
@@ -36,7 +38,14 @@ class CitiesDatabase:
         """
         if not city_name:
             return None
-            
+
+        key = (city_name, state, country)
+        if key not in self._lookup_cache:
+            self._lookup_cache[key] = self._find_city(city_name, state, country)
+        return self._lookup_cache[key]
+
+    def _find_city(self, city_name: str, state: str = None, country: str = None) -> Optional[Dict[str, Any]]:
+        """Resolve a city entry, falling back to case-insensitive scans of the database"""
         self._load_cities()
         
         # Normalize city name
@@ -350,7 +350,8 @@ async def stitch_audio(opening: bytes, body: bytes, add_silence: bool = True, au
     Returns:
         Combined audio bytes in the specified format
     """
-    try:
+    # pydub decodes and encodes through ffmpeg, so run in thread pool to avoid blocking event loop
+    def _stitch():
         # pydub uses "ogg" for both .ogg and .opus files
         pydub_format = "ogg" if audio_format == "opus" else audio_format
         opening_seg = AudioSegment.from_file(io.BytesIO(opening), format=pydub_format)
@@ -376,6 +377,8 @@ async def stitch_audio(opening: bytes, body: bytes, add_silence: bool = True, au
         combined.export(output, format=export_format, parameters=export_params)
         return output.getvalue()
 
+    try:
+        return await asyncio.to_thread(_stitch)
     except Exception as e:
         logger.error(f"Error stitching audio: {e}", exc_info=True)
         raise
@@ -394,10 +397,12 @@ async def stitch_audio_multi(segments: List[bytes], add_silence: bool = True, au
     Returns:
         Combined audio bytes in the specified format
     """
-    try:
-        if not segments:
-            raise ValueError("No audio segments provided")
+    if not segments:
+        logger.error("Error stitching multiple audio segments: No audio segments provided")
+        raise ValueError("No audio segments provided")
 
+    # pydub decodes and encodes through ffmpeg, so run in thread pool to avoid blocking event loop
+    def _stitch_multi():
         pydub_format = "ogg" if audio_format == "opus" else audio_format
         combined = AudioSegment.empty()
 
@@ -416,11 +421,32 @@ async def stitch_audio_multi(segments: List[bytes], add_silence: bool = True, au
         combined.export(output, format=export_format, parameters=export_params)
         return output.getvalue()
 
+    try:
+        return await asyncio.to_thread(_stitch_multi)
     except Exception as e:
         logger.error(f"Error stitching multiple audio segments: {e}", exc_info=True)
         raise
 
 
+def _prepend_silence(audio: bytes, audio_format: str) -> bytes:
+    """Add 1 second of silence at the start of the audio (blocking, runs ffmpeg)"""
+    pydub_format = "ogg" if audio_format == "opus" else audio_format
+    export_format = "ogg" if audio_format == "opus" else audio_format
+    export_params = ["-acodec", "libopus"] if audio_format == "opus" else []
+
+    silence = AudioSegment.silent(duration=1000)
+    combined = silence + AudioSegment.from_file(io.BytesIO(audio), format=pydub_format)
+
+    output = io.BytesIO()
+    combined.export(output, format=export_format, parameters=export_params)
+    return output.getvalue()
+
+
+async def prepend_silence(audio: bytes, audio_format: str) -> bytes:
+    """Add 1 second of silence at the start of the audio, re-encoding off the event loop"""
+    return await asyncio.to_thread(_prepend_silence, audio, audio_format)
+
+
 async def get_static_intro_audio(convert_text_to_speech_fn, audio_format: str = "mp3") -> Optional[bytes]:
     """Get or generate static intro audio for /free/scan
 
@@ -445,18 +471,7 @@ async def get_static_intro_audio(convert_text_to_speech_fn, audio_format: str =
     try:
         audio, error, _, _, _ = await convert_text_to_speech_fn(FREE_SCAN_INTRO)
         if audio and not error:
-            pydub_format = "ogg" if audio_format == "opus" else audio_format
-            export_format = "ogg" if audio_format == "opus" else audio_format
-            export_params = ["-acodec", "libopus"] if audio_format == "opus" else []
-
-            # Add 1 second silence at start
-            silence = AudioSegment.silent(duration=1000)
-            intro_seg = AudioSegment.from_file(io.BytesIO(audio), format=pydub_format)
-            combined = silence + intro_seg
-
-            output = io.BytesIO()
-            combined.export(output, format=export_format, parameters=export_params)
-            final_audio = output.getvalue()
+            final_audio = await asyncio.to_thread(_prepend_silence, audio, audio_format)
 
             # Cache for future use
             asyncio.create_task(s3_cache.set(static_intro_key, final_audio))
@@ -492,18 +507,7 @@ async def get_empty_pool_audio(convert_text_to_speech_fn, audio_format: str = "m
     try:
         audio, error, _, _, _ = await convert_text_to_speech_fn(empty_pool_text)
         if audio and not error:
-            pydub_format = "ogg" if audio_format == "opus" else audio_format
-            export_format = "ogg" if audio_format == "opus" else audio_format
-            export_params = ["-acodec", "libopus"] if audio_format == "opus" else []
-
-            # Add 1 second silence at start
-            silence = AudioSegment.silent(duration=1000)
-            msg_seg = AudioSegment.from_file(io.BytesIO(audio), format=pydub_format)
-            combined = silence + msg_seg
-
-            output = io.BytesIO()
-            combined.export(output, format=export_format, parameters=export_params)
-            final_audio = output.getvalue()
+            final_audio = await asyncio.to_thread(_prepend_silence, audio, audio_format)
 
             # Cache for future use
             asyncio.create_task(s3_cache.set(empty_pool_key, final_audio))
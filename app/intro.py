@@ -3,7 +3,7 @@ Intro endpoint for streaming MP3 file from S3
 """
 
 from fastapi import Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 import httpx
 import hashlib
 import uuid
@@ -126,8 +126,8 @@ async def stream_intro(request: Request, lat: float = None, lng: float = None):
 
 async def intro_options():
     """Handle CORS preflight requests for /intro endpoint"""
-    return StreamingResponse(
-        iter([b""]),
+    return Response(
+        status_code=204,
         headers={
             "Access-Control-Allow-Origin": "*",
             "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
@@ -1,11 +1,14 @@
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import StreamingResponse, HTMLResponse
+from fastapi.responses import Response, StreamingResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 import httpx
+import orjson
 import os
 import sys
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from typing import List, Dict, Any, Optional
 
 # Configure logging with explicit format and stream
@@ -55,6 +58,7 @@ from .tts_providers import (
     get_audio_format as get_tts_audio_format,
     get_voice_folder as get_tts_voice_folder,
 )
+from .tts_providers.http_client import close_client as close_tts_client
 
 # Initialize Sentry for error monitoring (only if DSN is configured)
 import sentry_sdk
@@ -69,14 +73,72 @@ if os.getenv("SENTRY_DSN"):
     )
     logger.info("Sentry error monitoring initialized")
 
-app = FastAPI()
+# Thread pool for blocking work (Gemini SDK, ffmpeg/pydub audio processing) offloaded via asyncio.to_thread
+AUDIO_THREAD_POOL_SIZE = int(os.getenv("AUDIO_THREAD_POOL_SIZE", "32"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    executor = ThreadPoolExecutor(max_workers=AUDIO_THREAD_POOL_SIZE, thread_name_prefix="audio")
+    asyncio.get_running_loop().set_default_executor(executor)
+    yield
+    # Release pooled upstream connections
+    await close_tts_client()
+    await s3_cache.close()
+    executor.shutdown(wait=False)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib json module"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Every audio endpoint answers CORS preflights the same way, so one prebuilt
+# 204 is shared by all of them
+_PREFLIGHT_RESPONSE = Response(
+    status_code=204,
+    headers={
+        "Access-Control-Allow-Origin": "*",
+        "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
+        "Access-Control-Allow-Headers": "Range, Content-Range, Content-Length",
+        "Access-Control-Max-Age": "3600"
+    }
+)
+
+
+# Cache-Control per top-level /assets directory. Images and fonts only change
+# between deploys; Yoto playlists are fetched by devices and edited in place,
+# so they always revalidate against the ETag StaticFiles already sends
+_ASSET_CACHE_CONTROL = {
+    "img": "public, max-age=86400",
+    "fonts": "public, max-age=86400",
+}
+_DEFAULT_ASSET_CACHE_CONTROL = "no-cache"
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers and the CDN cache long-lived assets between deploys"""
+
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        top_dir = self.get_path(scope).replace(os.sep, "/").split("/", 1)[0]
+        response.headers.setdefault(
+            "Cache-Control", _ASSET_CACHE_CONTROL.get(top_dir, _DEFAULT_ASSET_CACHE_CONTROL)
+        )
+        return response
 
-# Serve static assets
-app.mount("/assets", StaticFiles(directory="assets"), name="assets")
 
-# Register website home routes
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+# Register website home routes (before the /assets mount, which would
+# otherwise shadow the fingerprinted home page CSS/JS under /assets)
 register_website_home_routes(app)
 
+# Serve static assets
+app.mount("/assets", CachedStaticFiles(directory="assets"), name="assets")
+
 # Register test Gemini TTS routes
 register_test_gemini_tts_routes(app)
 
@@ -1238,67 +1300,27 @@ async def plane_5_endpoint(
 @app.options("/plane/1")
 async def plane_1_options():
     """Handle CORS preflight requests for /plane/1 endpoint"""
-    return StreamingResponse(
-        iter([b""]),
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
-            "Access-Control-Allow-Headers": "Range, Content-Range, Content-Length",
-            "Access-Control-Max-Age": "3600"
-        }
-    )
+    return _PREFLIGHT_RESPONSE
 
 @app.options("/plane/2")
 async def plane_2_options():
     """Handle CORS preflight requests for /plane/2 endpoint"""
-    return StreamingResponse(
-        iter([b""]),
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
-            "Access-Control-Allow-Headers": "Range, Content-Range, Content-Length",
-            "Access-Control-Max-Age": "3600"
-        }
-    )
+    return _PREFLIGHT_RESPONSE
 
 @app.options("/plane/3")
 async def plane_3_options():
     """Handle CORS preflight requests for /plane/3 endpoint"""
-    return StreamingResponse(
-        iter([b""]),
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
-            "Access-Control-Allow-Headers": "Range, Content-Range, Content-Length",
-            "Access-Control-Max-Age": "3600"
-        }
-    )
+    return _PREFLIGHT_RESPONSE
 
 @app.options("/plane/4")
 async def plane_4_options():
     """Handle CORS preflight requests for /plane/4 endpoint"""
-    return StreamingResponse(
-        iter([b""]),
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
-            "Access-Control-Allow-Headers": "Range, Content-Range, Content-Length",
-            "Access-Control-Max-Age": "3600"
-        }
-    )
+    return _PREFLIGHT_RESPONSE
 
 @app.options("/plane/5")
 async def plane_5_options():
     """Handle CORS preflight requests for /plane/5 endpoint"""
-    return StreamingResponse(
-        iter([b""]),
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
-            "Access-Control-Allow-Headers": "Range, Content-Range, Content-Length",
-            "Access-Control-Max-Age": "3600"
-        }
-    )
+    return _PREFLIGHT_RESPONSE
 
 
 # =============================================================================
@@ -1312,6 +1334,7 @@ from .free_pool import (
     get_session_for_free_user,
     check_free_tier_rate_limit,
     get_empty_pool_audio,
+    prepend_silence,
     stitch_audio,
 )
 
@@ -1530,17 +1553,7 @@ async def handle_free_plane_endpoint(request: Request, plane_index: int):
     if not intro_audio:
         # No intro available, just return body with silence
         logger.warning("No free intro audio available, serving body only")
-        from pydub import AudioSegment
-        import io
-        pydub_format = "ogg" if file_ext == "opus" else file_ext
-        export_format = "ogg" if file_ext == "opus" else file_ext
-        export_params = ["-acodec", "libopus"] if file_ext == "opus" else []
-        silence = AudioSegment.silent(duration=1000)
-        body_seg = AudioSegment.from_file(io.BytesIO(body_audio), format=pydub_format)
-        combined_seg = silence + body_seg
-        output = io.BytesIO()
-        combined_seg.export(output, format=export_format, parameters=export_params)
-        combined = output.getvalue()
+        combined = await prepend_silence(body_audio, file_ext)
     else:
         # Stitch: silence + random intro + body
         combined = await stitch_audio(intro_audio, body_audio, add_silence=True, audio_format=file_ext)
@@ -1658,15 +1671,7 @@ async def free_overandout_endpoint(request: Request):
 @app.options("/free/scan")
 async def free_scan_options():
     """Handle CORS preflight requests for /free/scan endpoint"""
-    return StreamingResponse(
-        iter([b""]),
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
-            "Access-Control-Allow-Headers": "Range, Content-Range, Content-Length",
-            "Access-Control-Max-Age": "3600"
-        }
-    )
+    return _PREFLIGHT_RESPONSE
 
 
 @app.get("/free/plane/1")
@@ -1700,85 +1705,37 @@ async def free_plane_3_endpoint(request: Request):
 @app.options("/free/plane/1")
 async def free_plane_1_options():
     """Handle CORS preflight requests for /free/plane/1 endpoint"""
-    return StreamingResponse(
-        iter([b""]),
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
-            "Access-Control-Allow-Headers": "Range, Content-Range, Content-Length",
-            "Access-Control-Max-Age": "3600"
-        }
-    )
+    return _PREFLIGHT_RESPONSE
 
 
 @app.options("/free/plane/2")
 async def free_plane_2_options():
     """Handle CORS preflight requests for /free/plane/2 endpoint"""
-    return StreamingResponse(
-        iter([b""]),
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
-            "Access-Control-Allow-Headers": "Range, Content-Range, Content-Length",
-            "Access-Control-Max-Age": "3600"
-        }
-    )
+    return _PREFLIGHT_RESPONSE
 
 
 @app.options("/free/plane/3")
 async def free_plane_3_options():
     """Handle CORS preflight requests for /free/plane/3 endpoint"""
-    return StreamingResponse(
-        iter([b""]),
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
-            "Access-Control-Allow-Headers": "Range, Content-Range, Content-Length",
-            "Access-Control-Max-Age": "3600"
-        }
-    )
+    return _PREFLIGHT_RESPONSE
 
 
 @app.options("/free/scanning")
 async def free_scanning_options():
     """Handle CORS preflight requests for /free/scanning endpoint"""
-    return StreamingResponse(
-        iter([b""]),
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
-            "Access-Control-Allow-Headers": "Range, Content-Range, Content-Length",
-            "Access-Control-Max-Age": "3600"
-        }
-    )
+    return _PREFLIGHT_RESPONSE
 
 
 @app.options("/free/scanning-again")
 async def free_scanning_again_options():
     """Handle CORS preflight requests for /free/scanning-again endpoint"""
-    return StreamingResponse(
-        iter([b""]),
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
-            "Access-Control-Allow-Headers": "Range, Content-Range, Content-Length",
-            "Access-Control-Max-Age": "3600"
-        }
-    )
+    return _PREFLIGHT_RESPONSE
 
 
 @app.options("/free/overandout")
 async def free_overandout_options():
     """Handle CORS preflight requests for /free/overandout endpoint"""
-    return StreamingResponse(
-        iter([b""]),
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
-            "Access-Control-Allow-Headers": "Range, Content-Range, Content-Length",
-            "Access-Control-Max-Age": "3600"
-        }
-    )
+    return _PREFLIGHT_RESPONSE
 
 
 if __name__ == "__main__":
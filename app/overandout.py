@@ -3,7 +3,7 @@ Overandout endpoint for streaming MP3 file from S3
 """
 
 from fastapi import Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 import httpx
 import hashlib
 import uuid
@@ -127,8 +127,8 @@ async def stream_overandout(request: Request, lat: float = None, lng: float = No
 
 async def overandout_options():
     """Handle CORS preflight requests for /overandout endpoint"""
-    return StreamingResponse(
-        iter([b""]),
+    return Response(
+        status_code=204,
         headers={
             "Access-Control-Allow-Origin": "*",
             "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
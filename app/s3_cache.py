@@ -40,6 +40,10 @@ class S3MP3Cache:
         # Shared HTTP client for connection pooling (lazy initialized)
         self._client: Optional[httpx.AsyncClient] = None
 
+        # SigV4 signing key, cached per UTC date
+        self._signing_key: Optional[bytes] = None
+        self._signing_key_date: Optional[str] = None
+
         if not self.aws_access_key or not self.aws_secret_key:
             logger.warning("AWS credentials not configured - S3 cache disabled")
             self.enabled = False
@@ -148,6 +152,23 @@ class S3MP3Cache:
                 # For other exceptions, don't retry
                 raise
 
+    def _get_signing_key(self, datestamp: str) -> bytes:
+        """Get the SigV4 signing key for a date, deriving it only once per day
+
+        Credentials and region are fixed for the process lifetime, so the
+        four-step HMAC chain only depends on the date.
+        """
+        if self._signing_key_date != datestamp:
+            def sign(key, msg):
+                return hmac.new(key, msg.encode('utf-8'), hashlib.sha256).digest()
+
+            k_date = sign(('AWS4' + self.aws_secret_key).encode('utf-8'), datestamp)
+            k_region = sign(k_date, self.aws_region)
+            k_service = sign(k_region, 's3')
+            self._signing_key = sign(k_service, 'aws4_request')
+            self._signing_key_date = datestamp
+        return self._signing_key
+
     def _create_aws_signature(self, method: str, url: str, headers: dict, payload: bytes) -> dict:
         """Create AWS Signature Version 4 headers for S3 request"""
         from urllib.parse import urlparse
@@ -191,18 +212,7 @@ class S3MP3Cache:
         credential_scope = f'{datestamp}/{self.aws_region}/s3/aws4_request'
         string_to_sign = f'{algorithm}\n{amzdate}\n{credential_scope}\n{hashlib.sha256(canonical_request.encode()).hexdigest()}'
         
-        # Create signing key
-        def sign(key, msg):
-            return hmac.new(key, msg.encode('utf-8'), hashlib.sha256).digest()
-        
-        def getSignatureKey(key, dateStamp, regionName, serviceName):
-            kDate = sign(('AWS4' + key).encode('utf-8'), dateStamp)
-            kRegion = sign(kDate, regionName)
-            kService = sign(kRegion, serviceName)
-            kSigning = sign(kService, "aws4_request")
-            return kSigning
-        
-        signing_key = getSignatureKey(self.aws_secret_key, datestamp, self.aws_region, 's3')
+        signing_key = self._get_signing_key(datestamp)
         signature = hmac.new(signing_key, string_to_sign.encode('utf-8'), hashlib.sha256).hexdigest()
         
         # Create authorization header
@@ -8,7 +8,7 @@ import hashlib
 import uuid
 import time
 from fastapi import Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 import httpx
 from .s3_cache import s3_cache
 from .flight_text import generate_flight_text, get_plane_sentence_override
@@ -456,8 +456,8 @@ async def stream_scanning(request: Request, lat: float = None, lng: float = None
 
 async def scanning_options():
     """Handle CORS preflight requests for /scanning endpoint"""
-    return StreamingResponse(
-        iter([b""]),
+    return Response(
+        status_code=204,
         headers={
             "Access-Control-Allow-Origin": "*",
             "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
@@ -0,0 +1,96 @@
+const video = document.getElementById('mainVideo');
+const loading = document.getElementById('loading');
+const playButton = document.getElementById('playButton');
+
+// Handle video loading
+video.addEventListener('loadstart', () => {
+    loading.style.display = 'block';
+});
+
+video.addEventListener('canplay', () => {
+    loading.style.display = 'none';
+
+    // Try to play with sound first
+    video.muted = false;
+    const playPromise = video.play();
+
+    if (playPromise !== undefined) {
+        playPromise.catch(() => {
+            // If autoplay with sound fails, fall back to muted autoplay
+            video.muted = true;
+            video.play().then(() => {
+                // Show button to enable sound
+                playButton.classList.remove('hidden');
+            }).catch(() => {
+                // If even muted autoplay fails, show play button
+                playButton.classList.remove('hidden');
+                playButton.textContent = '▶ Click to Play';
+            });
+        });
+    }
+});
+
+// Fall back to the YouTube embed, created only once the video file has failed
+// so working visitors never fetch or parse it
+const YOUTUBE_FALLBACK_SRC = 'https://www.youtube.com/embed/heSlOrH17po?autoplay=1&mute=1&loop=1&playlist=heSlOrH17po&controls=0&showinfo=0&rel=0&iv_load_policy=3&modestbranding=1';
+
+function showYouTubeFallback() {
+    if (!video.isConnected) {
+        return;
+    }
+    loading.textContent = 'Loading YouTube player...';
+    loading.style.display = 'block';
+
+    const iframe = document.createElement('iframe');
+    iframe.src = YOUTUBE_FALLBACK_SRC;
+    iframe.title = 'Dreaming of a Jet Plane - Yoto Plane Scanner Demo Video';
+    iframe.className = 'video-fallback';
+    iframe.allowFullscreen = true;
+    iframe.addEventListener('load', () => {
+        loading.style.display = 'none';
+    });
+    video.replaceWith(iframe);
+    playButton.classList.add('hidden');
+}
+
+// A failing <source> reports the error on itself, not on the <video>
+video.addEventListener('error', showYouTubeFallback);
+video.querySelectorAll('source').forEach((source) => {
+    source.addEventListener('error', showYouTubeFallback);
+});
+// The script is deferred, so the source may already have failed by now
+if (video.networkState === HTMLMediaElement.NETWORK_NO_SOURCE) {
+    showYouTubeFallback();
+}
+
+// Handle click to play with sound
+playButton.addEventListener('click', () => {
+    video.muted = false;
+    video.play();
+    playButton.classList.add('hidden');
+});
+
+// Hide cursor after inactivity: mousemove only records the time and arms a
+// timer when none is pending; the timer re-arms itself for whatever idle
+// time is still left, so nothing runs per event and nothing runs while idle
+const CURSOR_IDLE_MS = 3000;
+let lastMouseMove = 0;
+let cursorTimer = null;
+
+function checkCursorIdle() {
+    const remaining = lastMouseMove + CURSOR_IDLE_MS - Date.now();
+    if (remaining > 0) {
+        cursorTimer = setTimeout(checkCursorIdle, remaining);
+    } else {
+        cursorTimer = null;
+        document.body.classList.add('idle');
+    }
+}
+
+document.addEventListener('mousemove', () => {
+    lastMouseMove = Date.now();
+    if (cursorTimer === null) {
+        document.body.classList.remove('idle');
+        cursorTimer = setTimeout(checkCursorIdle, CURSOR_IDLE_MS);
+    }
+}, { passive: true });
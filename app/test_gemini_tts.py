@@ -52,7 +52,7 @@ def register_test_gemini_tts_routes(app: FastAPI):
             VOICE_NAME = "Sadachbia"
             VOICE_PROMPT = "Read the text in a posh British male voice, rich baritone with a low pitch. Use precise articulation and a refined, formal delivery with minimal inflection."
 
-            logger.info(f"Gemini TTS Test Request: Model={MODEL_ID}, Voice={VOICE_NAME}, Text='{text[:50]}...'")
+            logger.info("Gemini TTS Test Request: Model=%s, Voice=%s, Text='%.50s...'", MODEL_ID, VOICE_NAME, text)
 
             # Start timing
             start_time = time.time()
@@ -81,7 +81,7 @@ def register_test_gemini_tts_routes(app: FastAPI):
             # Extract PCM data from response
             pcm_data = response.candidates[0].content.parts[0].inline_data.data
             api_time = time.time() - start_time
-            logger.info(f"Gemini API complete: {len(pcm_data)} bytes PCM in {api_time:.2f}s")
+            logger.info("Gemini API complete: %d bytes PCM in %.2fs", len(pcm_data), api_time)
 
             # Convert PCM to MP3 using ffmpeg
             ffmpeg_process = subprocess.Popen(
@@ -105,7 +105,7 @@ def register_test_gemini_tts_routes(app: FastAPI):
             mp3_data, ffmpeg_error = ffmpeg_process.communicate(input=pcm_data)
 
             total_time = time.time() - start_time
-            logger.info(f"Conversion complete: {len(mp3_data)} bytes MP3 in {total_time:.2f}s total")
+            logger.info("Conversion complete: %d bytes MP3 in %.2fs total", len(mp3_data), total_time)
 
             # Return MP3 audio
             return Response(
@@ -118,9 +118,9 @@ def register_test_gemini_tts_routes(app: FastAPI):
             )
 
         except ImportError as e:
-            logger.error(f"Gemini TTS Test ImportError: {str(e)}")
+            logger.error("Gemini TTS Test ImportError: %s", e)
             return {"error": f"Import error: {str(e)}", "hint": "Install google-genai"}
 
         except Exception as e:
-            logger.error(f"Gemini TTS Test Error: {str(e)}")
+            logger.error("Gemini TTS Test Error: %s", e)
             return {"error": str(e), "model": "gemini-2.5-pro-preview-tts"}
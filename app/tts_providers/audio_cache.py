@@ -0,0 +1,54 @@
+"""In-process LRU cache for synthesized TTS audio"""
+
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+TTS_AUDIO_CACHE_MB = int(os.getenv("TTS_AUDIO_CACHE_MB", "20"))
+
+
+class AudioCache:
+    """Byte-size bounded LRU of audio keyed on everything that shapes the synthesis
+
+    Template phrases (intros, sign-offs, "no planes" messages) get synthesized
+    with identical settings over and over, so repeats are served from memory
+    instead of another provider round-trip.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Build a cache key from the provider name, text and voice settings"""
+        return hashlib.sha1("\x1f".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        audio = self._entries.get(key)
+        if audio is not None:
+            self._entries.move_to_end(key)
+        return audio
+
+    def set(self, key: str, audio: bytes) -> None:
+        if len(audio) > self.max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous)
+
+        self._entries[key] = audio
+        self._size += len(audio)
+
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+
+audio_cache = AudioCache(TTS_AUDIO_CACHE_MB * 1024 * 1024)
@@ -6,6 +6,9 @@ from typing import Optional, Tuple
 
 import httpx
 
+from .audio_cache import audio_cache
+from .http_client import get_client
+
 DISPLAY_NAME = "ElevenLabs"
 
 logger = logging.getLogger(__name__)
@@ -13,6 +16,7 @@ logger = logging.getLogger(__name__)
 ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_TEXT_TO_VOICE_API_KEY")
 ELEVENLABS_BASE_URL = "https://api.elevenlabs.io/v1"
 DEFAULT_VOICE_ID = "goT3UYdM9bhm0n2lmKQx"  # Edward voice - British, Dark, Seductive, Low
+MODEL_ID = "eleven_turbo_v2"
 
 
 def is_configured() -> Tuple[bool, Optional[str]]:
@@ -35,6 +39,11 @@ async def generate_audio(text: str) -> Tuple[bytes, str]:
         logger.warning(reason)
         return b"", reason or "ElevenLabs provider unavailable"
 
+    cache_key = audio_cache.make_key("elevenlabs", text, DEFAULT_VOICE_ID, MODEL_ID)
+    cached = audio_cache.get(cache_key)
+    if cached is not None:
+        return cached, ""
+
     try:
         # Add 1 second pause at the start of the text
         text_with_pause = '<break time="1s"/>' + text
@@ -49,28 +58,29 @@ async def generate_audio(text: str) -> Tuple[bytes, str]:
 
         payload = {
             "text": text_with_pause,
-            "model_id": "eleven_turbo_v2",
+            "model_id": MODEL_ID,
             "voice_settings": {
                 "stability": 0.6,
                 "similarity_boost": 0.5
             }
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(url, json=payload, headers=headers)
+        client = get_client()
+        response = await client.post(url, json=payload, headers=headers)
 
-            if response.status_code == 200:
-                return response.content, ""
-            else:
-                logger.error(f"ElevenLabs API error: {response.status_code}")
-                return b"", f"ElevenLabs API returned status {response.status_code}"
+        if response.status_code == 200:
+            audio_cache.set(cache_key, response.content)
+            return response.content, ""
+        else:
+            logger.error("ElevenLabs API error: %s", response.status_code)
+            return b"", f"ElevenLabs API returned status {response.status_code}"
 
     except httpx.TimeoutException:
         logger.error("ElevenLabs API timeout")
         return b"", "ElevenLabs API timeout (30 seconds exceeded)"
     except httpx.RequestError as e:
-        logger.error(f"ElevenLabs API connection error: {str(e)}")
+        logger.error("ElevenLabs API connection error: %s", e)
         return b"", f"ElevenLabs API connection error: {str(e)}"
     except Exception as e:
-        logger.error(f"ElevenLabs API error: {str(e)}")
+        logger.error("ElevenLabs API error: %s", e)
         return b"", f"ElevenLabs API unexpected error: {str(e)}"
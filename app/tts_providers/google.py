@@ -7,6 +7,8 @@ import subprocess
 import time
 from typing import Optional, Tuple
 
+from .audio_cache import audio_cache
+
 DISPLAY_NAME = "Google Gemini"
 
 logger = logging.getLogger(__name__)
@@ -34,6 +36,12 @@ async def generate_audio(text: str) -> Tuple[bytes, str]:
         logger.warning(reason)
         return b"", reason or "Google Gemini provider unavailable"
 
+    # Model, voice and prompt are fixed below, so the text alone identifies the audio
+    cache_key = audio_cache.make_key("google", text)
+    cached = audio_cache.get(cache_key)
+    if cached is not None:
+        return cached, ""
+
     try:
         # Import Google GenAI SDK
         from google import genai
@@ -47,7 +55,7 @@ async def generate_audio(text: str) -> Tuple[bytes, str]:
         VOICE_NAME = "Sadachbia"
         VOICE_PROMPT = "Read the text in a posh British male voice, with a deep, rich baritone tone. Use precise articulation and a refined, formal delivery with minimal inflection and a very even pitch."
 
-        logger.info(f"Gemini TTS Request: Model={MODEL_ID}, Voice={VOICE_NAME}, Text='{text[:50]}...'")
+        logger.info("Gemini TTS Request: Model=%s, Voice=%s, Text='%.50s...'", MODEL_ID, VOICE_NAME, text)
 
         # Start timing
         start_time = time.time()
@@ -79,7 +87,7 @@ async def generate_audio(text: str) -> Tuple[bytes, str]:
         # Extract PCM data from response
         pcm_data = response.candidates[0].content.parts[0].inline_data.data
         api_time = time.time() - start_time
-        logger.info(f"Gemini API complete: {len(pcm_data)} bytes PCM in {api_time:.2f}s")
+        logger.info("Gemini API complete: %d bytes PCM in %.2fs", len(pcm_data), api_time)
 
         # Convert PCM to MP3 using ffmpeg (run in thread pool to avoid blocking event loop)
         # Adds 1 second of silence at the start for Yoto player compatibility
@@ -106,13 +114,16 @@ async def generate_audio(text: str) -> Tuple[bytes, str]:
         mp3_data, ffmpeg_error = await asyncio.to_thread(_convert_pcm_to_mp3)
 
         total_time = time.time() - start_time
-        logger.info(f"Conversion complete: {len(mp3_data)} bytes MP3 in {total_time:.2f}s total")
+        logger.info("Conversion complete: %d bytes MP3 in %.2fs total", len(mp3_data), total_time)
+
+        if mp3_data:
+            audio_cache.set(cache_key, mp3_data)
 
         return mp3_data, ""
 
     except ImportError as e:
-        logger.error(f"Gemini TTS ImportError: {str(e)}")
+        logger.error("Gemini TTS ImportError: %s", e)
         return b"", f"Gemini TTS import error: {str(e)}"
     except Exception as e:
-        logger.error(f"Gemini TTS Error: {str(e)}")
+        logger.error("Gemini TTS Error: %s", e)
         return b"", f"Gemini TTS unexpected error: {str(e)}"
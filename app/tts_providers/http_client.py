@@ -0,0 +1,34 @@
+"""Shared HTTP client for TTS provider API calls"""
+
+from typing import Optional
+
+import httpx
+
+# Synthesis can take a while for long texts, but connecting should be quick
+TTS_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# Shared HTTP client for connection pooling (lazy initialized)
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client so TTS calls reuse TCP+TLS connections"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_keepalive_connections=10,
+                max_connections=20,
+                keepalive_expiry=30.0
+            ),
+            timeout=TTS_TIMEOUT
+        )
+    return _client
+
+
+async def close_client():
+    """Close the shared HTTP client"""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
@@ -1,66 +1,175 @@
 """Inworld TTS provider implementation"""
 
-import base64
 import binascii
-import io
 import logging
-import os
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import AsyncIterator, Optional, Tuple
 
 import httpx
-from pydub import AudioSegment
+import orjson
+import pybase64
+
+from .audio_cache import audio_cache
+from .http_client import get_client
+from .settings import InworldSettings, get_inworld_settings
 
 DISPLAY_NAME = "Inworld TTS"
 
 logger = logging.getLogger(__name__)
 
-INWORLD_API_KEY = os.getenv("INWORLD_API_KEY")
-INWORLD_MODEL_ID = os.getenv("INWORLD_MODEL_ID", "inworld-tts-1.5-max")
-INWORLD_VOICE_ID = os.getenv("INWORLD_VOICE_ID", "Ronald")
-INWORLD_AUDIO_ENCODING = os.getenv("INWORLD_AUDIO_ENCODING", "OGG_OPUS")
-INWORLD_SPEAKING_RATE = float(os.getenv("INWORLD_SPEAKING_RATE", "1"))
-INWORLD_TEMPERATURE = float(os.getenv("INWORLD_TEMPERATURE", "1.3"))
-INWORLD_BASE_URL = os.getenv("INWORLD_TTS_BASE_URL", "https://api.inworld.ai/tts/v1/voice")
+# Leading pause for Yoto player compatibility, rendered by Inworld itself so the
+# audio never needs decoding and re-encoding on our side
+SILENCE_PREFIX_MARKUP = '<break time="1s" /> '
+
+_AUDIO_CONTENT_KEY = b'"audioContent"'
+_STREAM_CHUNK_SIZE = 64 * 1024  # Response read size, which bounds each decoded audio chunk
 
 
 def is_configured() -> Tuple[bool, Optional[str]]:
     """Check whether the provider can be used"""
-    if not INWORLD_API_KEY:
+    if not get_inworld_settings().api_key:
         return False, "Inworld API key not configured"
     return True, None
 
 
-def _build_authorization_header() -> str:
-    key = (INWORLD_API_KEY or "").strip()
+@lru_cache(maxsize=1)
+def _build_authorization_header(api_key: Optional[str]) -> str:
+    # Cached on the key, so this only runs again if the settings are reloaded
+    key = (api_key or "").strip()
     if not key:
         return ""
 
     try:
-        base64.b64decode(key, validate=True)
+        pybase64.b64decode(key, validate=True)
         is_base64 = True
     except binascii.Error:
         is_base64 = False
 
     if not is_base64 or ":" in key:
         key_bytes = key.encode("utf-8")
-        key = base64.b64encode(key_bytes).decode("ascii")
+        key = pybase64.b64encode(key_bytes).decode("ascii")
 
     return f"Basic {key}"
 
 
-def _build_payload(text: str) -> dict:
+class InworldError(Exception):
+    """Raised when Inworld responds without usable audio"""
+
+
+class _AudioContentDecoder:
+    """Incrementally base64-decode the audioContent field of a streamed Inworld response
+
+    The response is a JSON object whose audioContent value is one large base64
+    string. Scanning for it in the raw byte stream lets audio be decoded and
+    handed on as it arrives instead of holding the JSON body, the parsed base64
+    str and the decoded audio in memory all at once.
+    """
+
+    def __init__(self):
+        self._pending = b""
+        self._state = "key"  # key -> value_start -> value -> done
+
+    @property
+    def found(self) -> bool:
+        return self._state == "done"
+
+    def feed(self, chunk: bytes) -> bytes:
+        """Consume a chunk of the response body and return any audio it completes"""
+        if self._state == "done":
+            return b""
+
+        data = self._pending + chunk
+        self._pending = b""
+
+        if self._state == "key":
+            idx = data.find(_AUDIO_CONTENT_KEY)
+            if idx == -1:
+                # Keep enough of the tail to match a key split across chunks
+                self._pending = data[-(len(_AUDIO_CONTENT_KEY) - 1):]
+                return b""
+            data = data[idx + len(_AUDIO_CONTENT_KEY):]
+            self._state = "value_start"
+
+        if self._state == "value_start":
+            idx = data.find(b'"')
+            if idx == -1:
+                self._pending = data
+                return b""
+            data = data[idx + 1:]
+            self._state = "value"
+
+        end = data.find(b'"')
+        if end != -1:
+            data = data[:end]
+            self._state = "done"
+
+        # Base64 never contains backslashes; the only legal escape here is "\/"
+        data = data.replace(b"\\", b"")
+
+        if self._state == "done":
+            return pybase64.b64decode(data, validate=False)
+
+        # Hold back a partial quantum until the next chunk completes it
+        aligned = len(data) - (len(data) % 4)
+        self._pending = data[aligned:]
+        return pybase64.b64decode(data[:aligned], validate=False)
+
+
+@lru_cache(maxsize=1)
+def _build_headers(settings: InworldSettings) -> dict:
     return {
-        "text": text,
-        "voice_id": INWORLD_VOICE_ID,
+        "Authorization": _build_authorization_header(settings.api_key),
+        "Content-Type": "application/json",
+    }
+
+
+@lru_cache(maxsize=1)
+def _payload_template(settings: InworldSettings) -> dict:
+    # Everything except the text is fixed by the settings, so build it once
+    return {
+        "voice_id": settings.voice_id,
         "audio_config": {
-            "audio_encoding": INWORLD_AUDIO_ENCODING,
-            "speaking_rate": INWORLD_SPEAKING_RATE,
+            "audio_encoding": settings.audio_encoding,
+            "speaking_rate": settings.speaking_rate,
         },
-        "temperature": INWORLD_TEMPERATURE,
-        "model_id": INWORLD_MODEL_ID,
+        "temperature": settings.temperature,
+        "model_id": settings.model_id,
     }
 
 
+def _build_payload(settings: InworldSettings, text: str) -> bytes:
+    return orjson.dumps({"text": SILENCE_PREFIX_MARKUP + text, **_payload_template(settings)})
+
+
+async def _iter_decoded_audio(text: str) -> AsyncIterator[bytes]:
+    """Yield raw Inworld audio as the streamed response is decoded"""
+    settings = get_inworld_settings()
+    client = get_client()
+    async with client.stream(
+        "POST", settings.base_url, headers=_build_headers(settings), content=_build_payload(settings, text)
+    ) as response:
+        if response.status_code != 200:
+            # Only pull the error body off the wire if it is actually going to be logged
+            if logger.isEnabledFor(logging.ERROR):
+                await response.aread()
+                logger.error("Inworld API error: %s - %s", response.status_code, response.text)
+            raise InworldError(f"Inworld API returned status {response.status_code}")
+
+        decoder = _AudioContentDecoder()
+        try:
+            async for chunk in response.aiter_bytes(_STREAM_CHUNK_SIZE):
+                audio = decoder.feed(chunk)
+                if audio:
+                    yield audio
+        except binascii.Error as exc:
+            logger.error("Failed to decode Inworld audio: %s", exc)
+            raise InworldError("Failed to decode Inworld audio") from exc
+
+    if not decoder.found:
+        logger.error("Inworld API response missing audioContent")
+        raise InworldError("Inworld API response missing audioContent")
+
+
 async def generate_audio(text: str) -> Tuple[bytes, str]:
     """Convert text to speech using Inworld's TTS API"""
     configured, reason = is_configured()
@@ -68,45 +177,32 @@ async def generate_audio(text: str) -> Tuple[bytes, str]:
         logger.warning(reason)
         return b"", reason or "Inworld provider unavailable"
 
-    headers = {
-        "Authorization": _build_authorization_header(),
-        "Content-Type": "application/json",
-    }
-
-    payload = _build_payload(text)
+    settings = get_inworld_settings()
+    # Above temperature 1 every render of the same text is a fresh sample, so
+    # only deterministic settings are cached
+    cache_key = None
+    if settings.temperature <= 1:
+        cache_key = audio_cache.make_key(
+            "inworld", text, settings.voice_id, settings.model_id, settings.audio_encoding,
+            settings.speaking_rate, settings.temperature,
+        )
+        cached = audio_cache.get(cache_key)
+        if cached is not None:
+            return cached, ""
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(INWORLD_BASE_URL, headers=headers, json=payload)
-            if response.status_code != 200:
-                logger.error("Inworld API error: %s - %s", response.status_code, response.text)
-                return b"", f"Inworld API returned status {response.status_code}"
-
-            data = response.json()
-            audio_content = data.get("audioContent")
-            if not audio_content:
-                logger.error("Inworld API response missing audioContent")
-                return b"", "Inworld API response missing audioContent"
-
-            try:
-                audio_bytes = base64.b64decode(audio_content)
-
-                # Prepend 1 second of silence to the audio
-                audio = AudioSegment.from_file(io.BytesIO(audio_bytes), format="ogg")
-                silence = AudioSegment.silent(duration=1000)  # 1000ms = 1 second
-                audio_with_pause = silence + audio
-
-                # Export back to bytes
-                output_buffer = io.BytesIO()
-                audio_with_pause.export(output_buffer, format="ogg", codec="libopus")
-                return output_buffer.getvalue(), ""
-
-            except binascii.Error as exc:
-                logger.error("Failed to decode Inworld audio: %s", exc)
-                return b"", "Failed to decode Inworld audio"
-            except Exception as exc:
-                logger.error("Failed to process Inworld audio with silence: %s", exc)
-                return b"", f"Failed to process Inworld audio: {exc}"
+        try:
+            audio_bytes = b"".join([audio async for audio in _iter_decoded_audio(text)])
+        except InworldError as exc:
+            return b"", str(exc)
+
+        if not audio_bytes:
+            logger.error("Inworld API response missing audioContent")
+            return b"", "Inworld API response missing audioContent"
+
+        if cache_key is not None:
+            audio_cache.set(cache_key, audio_bytes)
+        return audio_bytes, ""
 
     except httpx.TimeoutException:
         logger.error("Inworld API timeout")
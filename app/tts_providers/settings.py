@@ -0,0 +1,33 @@
+"""Environment-backed settings for TTS providers"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class InworldSettings:
+    """Inworld TTS configuration, parsed from the environment once"""
+
+    api_key: Optional[str]
+    model_id: str
+    voice_id: str
+    audio_encoding: str
+    speaking_rate: float
+    temperature: float
+    base_url: str
+
+
+@lru_cache(maxsize=1)
+def get_inworld_settings() -> InworldSettings:
+    """Load Inworld settings (call get_inworld_settings.cache_clear() to re-read the environment)"""
+    return InworldSettings(
+        api_key=os.getenv("INWORLD_API_KEY"),
+        model_id=os.getenv("INWORLD_MODEL_ID", "inworld-tts-1.5-max"),
+        voice_id=os.getenv("INWORLD_VOICE_ID", "Ronald"),
+        audio_encoding=os.getenv("INWORLD_AUDIO_ENCODING", "OGG_OPUS"),
+        speaking_rate=float(os.getenv("INWORLD_SPEAKING_RATE", "1")),
+        temperature=float(os.getenv("INWORLD_TEMPERATURE", "1.3")),
+        base_url=os.getenv("INWORLD_TTS_BASE_URL", "https://api.inworld.ai/tts/v1/voice"),
+    )
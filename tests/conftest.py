@@ -1,127 +1,252 @@
 """Pytest configuration and shared fixtures for tests"""
 
+from types import MappingProxyType
+
 import pytest
-import asyncio
 
+from app.aircraft_providers import AIRCRAFT_PROVIDERS
+from app.main import get_nearby_aircraft
+from app.s3_cache import s3_cache
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-live",
+        action="store_true",
+        default=False,
+        help="call the real aircraft providers instead of the canned responses",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-live"):
+        return
+    skip_live = pytest.mark.skip(reason="needs --run-live")
+    for item in items:
+        if "live" in item.keywords:
+            item.add_marker(skip_live)
+
+
+# Canned provider traffic per location, as (aircraft, airline, flight, origin city,
+# origin country, origin IATA, destination city, destination country, destination
+# IATA, distance km). Locations not listed here have empty skies.
+_CANNED_ROUTES = {
+    (40.71, -74.01): [
+        ("Boeing 737-800", "American Airlines", "AA123", "Boston", "United States", "BOS",
+         "Miami", "United States", "MIA", 18),
+        ("Airbus A321", "JetBlue", "B6415", "Chicago", "United States", "ORD",
+         "London", "United Kingdom", "LHR", 32),
+        ("Boeing 787-9", "United Airlines", "UA88", "Denver", "United States", "DEN",
+         "Tokyo", "Japan", "NRT", 47),
+        ("Airbus A320", "Delta Air Lines", "DL2201", "Atlanta", "United States", "ATL",
+         "London", "United Kingdom", "LGW", 64),
+    ],
+    (51.51, -0.13): [
+        ("Airbus A350-1000", "British Airways", "BA117", "Dubai", "United Arab Emirates", "DXB",
+         "New York", "United States", "JFK", 22),
+        ("Boeing 777-300ER", "Emirates", "EK2", "Paris", "France", "CDG",
+         "Dubai", "United Arab Emirates", "DXB", 39),
+        ("Airbus A320", "easyJet", "U28201", "Madrid", "Spain", "MAD",
+         "Edinburgh", "United Kingdom", "EDI", 55),
+    ],
+    (35.68, 139.65): [
+        ("Boeing 787-8", "Japan Airlines", "JL5", "Osaka", "Japan", "KIX",
+         "Sydney", "Australia", "SYD", 27),
+        ("Airbus A350-900", "Singapore Airlines", "SQ637", "Seoul", "South Korea", "ICN",
+         "Singapore", "Singapore", "SIN", 44),
+    ],
+    (41.22, -73.37): [
+        ("Embraer E175", "American Airlines", "AA4410", "Washington", "United States", "DCA",
+         "Boston", "United States", "BOS", 36),
+    ],
+}
+
+
+async def _fetch_canned_aircraft(lat, lng, radius_km, limit):
+    """Stand-in for a provider fetch that serves _CANNED_ROUTES"""
+    routes = _CANNED_ROUTES.get((round(lat, 2), round(lng, 2)), [])
+    aircraft_list = [
+        {
+            "aircraft": aircraft,
+            "airline_name": airline,
+            "flight_number": flight,
+            "origin_city": origin_city,
+            "origin_country": origin_country,
+            "origin_airport": origin_airport,
+            "destination_city": destination_city,
+            "destination_country": destination_country,
+            "destination_airport": destination_airport,
+            "distance_km": distance_km,
+            "distance_miles": round(distance_km * 0.621371),
+            "velocity": 450,
+            "altitude": 35000,
+        }
+        for (aircraft, airline, flight, origin_city, origin_country, origin_airport,
+             destination_city, destination_country, destination_airport, distance_km) in routes
+    ]
+    return aircraft_list[:limit], ""
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an event loop for async tests"""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
 
+async def _cache_miss(*args, **kwargs):
+    return None
 
-# Test locations
-@pytest.fixture
-def nyc_location():
-    """New York City coordinates - high traffic, US (imperial units)"""
-    return {"lat": 40.7128, "lng": -74.0060, "country_code": "US", "name": "NYC"}
 
+async def _cache_skip(*args, **kwargs):
+    return False
 
-@pytest.fixture
-def london_location():
-    """London coordinates - international hub (metric units)"""
-    return {"lat": 51.5074, "lng": -0.1278, "country_code": "GB", "name": "London"}
 
+@pytest.fixture(autouse=True, scope="session")
+def mock_aircraft_api(pytestconfig):
+    """Serve every aircraft provider from _CANNED_ROUTES unless --run-live is given
 
-@pytest.fixture
-def tokyo_location():
-    """Tokyo coordinates - Asia-Pacific (metric units)"""
-    return {"lat": 35.6762, "lng": 139.6503, "country_code": "JP", "name": "Tokyo"}
+    The S3 cache is bypassed too, so canned aircraft are never read from or
+    written to a real bucket.
+    """
+    if pytestconfig.getoption("--run-live"):
+        yield
+        return
 
+    with pytest.MonkeyPatch.context() as mp:
+        for name, definition in list(AIRCRAFT_PROVIDERS.items()):
+            mp.setitem(AIRCRAFT_PROVIDERS, name, {
+                **definition,
+                "fetch": _fetch_canned_aircraft,
+                "is_configured": lambda: (True, None),
+            })
+        mp.setattr(s3_cache, "get", _cache_miss)
+        mp.setattr(s3_cache, "set", _cache_skip)
+        yield
 
-@pytest.fixture
-def weston_ct_location():
-    """Weston, CT coordinates - small town, lower traffic"""
-    return {"lat": 41.2220, "lng": -73.3690, "country_code": "US", "name": "Weston CT"}
+
+# Test locations
+@pytest.fixture(scope="session")
+def nyc_location():
+    """New York City coordinates - high traffic, US (imperial units)"""
+    return MappingProxyType({"lat": 40.7128, "lng": -74.0060, "country_code": "US", "name": "NYC"})
 
 
-@pytest.fixture
-def sample_aircraft():
-    """Sample aircraft data for testing"""
-    return {
+@pytest.fixture(scope="session")
+def london_location():
+    """London coordinates - international hub (metric units)"""
+    return MappingProxyType({"lat": 51.5074, "lng": -0.1278, "country_code": "GB", "name": "London"})
+
+
+# Aircraft payloads, built once and shared read-only; tests that need to
+# mutate one take their own dict() copy
+_SAMPLE_AIRCRAFT = MappingProxyType({
+    "aircraft": "Boeing 737",
+    "origin_city": "Boston",
+    "origin_country": "United States",
+    "origin_airport": "BOS",
+    "destination_city": "New York",
+    "destination_country": "United States",
+    "destination_airport": "JFK",
+    "distance_km": 300,
+    "velocity": 450,
+    "altitude": 35000,
+    "flight_number": "AA123",
+    "airline_name": "American Airlines",
+})
+
+
+_SAMPLE_AIRCRAFT_LIST = tuple(MappingProxyType(aircraft) for aircraft in [
+    {
         "aircraft": "Boeing 737",
         "origin_city": "Boston",
         "origin_country": "United States",
-        "origin_airport": "BOS",
         "destination_city": "New York",
         "destination_country": "United States",
-        "destination_airport": "JFK",
         "distance_km": 300,
         "velocity": 450,
         "altitude": 35000,
-        "flight_number": "AA123",
-        "airline_name": "American Airlines",
-    }
+    },
+    {
+        "aircraft": "Airbus A320",
+        "origin_city": "Chicago",
+        "origin_country": "United States",
+        "destination_city": "Los Angeles",
+        "destination_country": "United States",
+        "distance_km": 500,
+        "velocity": 470,
+        "altitude": 37000,
+    },
+    {
+        "aircraft": "Boeing 787",
+        "origin_city": "London",
+        "origin_country": "United Kingdom",
+        "destination_city": "Dubai",
+        "destination_country": "United Arab Emirates",
+        "distance_km": 200,
+        "velocity": 500,
+        "altitude": 41000,
+    },
+])
+
+
+_DUPLICATE_DESTINATION_AIRCRAFT = tuple(MappingProxyType(aircraft) for aircraft in [
+    {
+        "aircraft": "Boeing 737",
+        "origin_city": "Boston",
+        "origin_country": "United States",
+        "destination_city": "New York",
+        "destination_country": "United States",
+        "destination_airport": "JFK",
+        "distance_km": 300,
+    },
+    {
+        "aircraft": "Airbus A320",
+        "origin_city": "Chicago",
+        "origin_country": "United States",
+        "destination_city": "New York",  # Duplicate
+        "destination_country": "United States",
+        "destination_airport": "LGA",
+        "distance_km": 500,
+    },
+    {
+        "aircraft": "Boeing 777",
+        "origin_city": "Atlanta",
+        "origin_country": "United States",
+        "destination_city": "Miami",  # Different
+        "destination_country": "United States",
+        "destination_airport": "MIA",
+        "distance_km": 400,
+    },
+])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_aircraft():
+    """Sample aircraft data for testing"""
+    return _SAMPLE_AIRCRAFT
+
+
+@pytest.fixture(scope="session")
 def sample_aircraft_list():
     """List of diverse sample aircraft for testing"""
-    return [
-        {
-            "aircraft": "Boeing 737",
-            "origin_city": "Boston",
-            "origin_country": "United States",
-            "destination_city": "New York",
-            "destination_country": "United States",
-            "distance_km": 300,
-            "velocity": 450,
-            "altitude": 35000,
-        },
-        {
-            "aircraft": "Airbus A320",
-            "origin_city": "Chicago",
-            "origin_country": "United States",
-            "destination_city": "Los Angeles",
-            "destination_country": "United States",
-            "distance_km": 500,
-            "velocity": 470,
-            "altitude": 37000,
-        },
-        {
-            "aircraft": "Boeing 787",
-            "origin_city": "London",
-            "origin_country": "United Kingdom",
-            "destination_city": "Dubai",
-            "destination_country": "United Arab Emirates",
-            "distance_km": 200,
-            "velocity": 500,
-            "altitude": 41000,
-        },
-    ]
+    return _SAMPLE_AIRCRAFT_LIST
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def duplicate_destination_aircraft():
     """Aircraft with duplicate destinations for testing"""
-    return [
-        {
-            "aircraft": "Boeing 737",
-            "origin_city": "Boston",
-            "origin_country": "United States",
-            "destination_city": "New York",
-            "destination_country": "United States",
-            "destination_airport": "JFK",
-            "distance_km": 300,
-        },
-        {
-            "aircraft": "Airbus A320",
-            "origin_city": "Chicago",
-            "origin_country": "United States",
-            "destination_city": "New York",  # Duplicate
-            "destination_country": "United States",
-            "destination_airport": "LGA",
-            "distance_km": 500,
-        },
-        {
-            "aircraft": "Boeing 777",
-            "origin_city": "Atlanta",
-            "origin_country": "United States",
-            "destination_city": "Miami",  # Different
-            "destination_country": "United States",
-            "destination_airport": "MIA",
-            "distance_km": 400,
-        },
-    ]
+    return _DUPLICATE_DESTINATION_AIRCRAFT
+
+
+@pytest.fixture
+def used_destinations():
+    """Fresh destination-tracking set for one multi-plane text generation run"""
+    return set()
+
+
+@pytest.fixture(scope="session")
+def cached_aircraft():
+    """get_nearby_aircraft memoized per (lat, lng, limit) for the whole session"""
+    cache = {}
+
+    async def fetch(lat, lng, limit=3):
+        key = (round(lat, 4), round(lng, 4), limit)
+        if key not in cache:
+            cache[key] = await get_nearby_aircraft(lat, lng, limit=limit)
+        return cache[key]
+
+    return fetch
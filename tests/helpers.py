@@ -0,0 +1,26 @@
+"""Shared assertion helpers and constants for tests"""
+
+from itertools import pairwise
+
+
+# Phrases every generated detection sentence must start with
+OPENING_WORDS = (
+    "Marvelous!", "Good Heavens!", "Fantastic!", "Splendid!", "What Luck!",
+    "Wow!", "Remarkable!", "Tremendous!", "Brilliant!", "By Jove!",
+)
+
+
+def is_sorted(values):
+    """True when values are in non-decreasing order (pairwise, no sorted or sliced copy)"""
+    return all(a <= b for a, b in pairwise(values))
+
+
+def unique_ratio_at_least(values, ratio):
+    """True when at least ratio of values are distinct, stopping once that is reached"""
+    needed = len(values) * ratio
+    seen = set()
+    for value in values:
+        seen.add(value)
+        if len(seen) >= needed:
+            return True
+    return len(seen) >= needed
@@ -1,85 +1,44 @@
 """Tests for aircraft selection and diversity logic"""
 
 import pytest
-from app.main import get_nearby_aircraft, select_diverse_aircraft
+from app.main import select_diverse_aircraft
+from tests.helpers import is_sorted, unique_ratio_at_least
 
 
-@pytest.mark.asyncio
-async def test_nyc_aircraft_selection(nyc_location):
-    """Test aircraft selection for NYC - should return up to 3 diverse aircraft"""
-    lat, lng = nyc_location["lat"], nyc_location["lng"]
-
-    aircraft, error = await get_nearby_aircraft(lat, lng, limit=3)
-
-    # Skip if API not configured
-    if "not configured" in error.lower():
-        pytest.skip(f"API not configured: {error}")
-
-    # Basic assertions
-    assert error == "", f"Unexpected error: {error}"
-    assert len(aircraft) <= 3, "Should return max 3 aircraft"
-
-    # NYC is a major hub, should have aircraft
-    if len(aircraft) > 0:
-        # Verify required fields exist
-        for plane in aircraft:
-            assert "aircraft" in plane, "Missing aircraft type"
-            assert "distance_km" in plane, "Missing distance"
-            # Note: origin/destination may be unknown for some aircraft
-    else:
-        pytest.skip("No aircraft found near NYC at this time")
-
-
-@pytest.mark.asyncio
-async def test_london_aircraft_selection(london_location):
-    """Test aircraft selection for London - international hub"""
-    lat, lng = london_location["lat"], london_location["lng"]
-
-    aircraft, error = await get_nearby_aircraft(lat, lng, limit=3)
-
-    # Skip if API not configured
-    if "not configured" in error.lower():
-        pytest.skip(f"API not configured: {error}")
-
-    assert error == "", f"Unexpected error: {error}"
-    assert len(aircraft) <= 3, "Should return max 3 aircraft"
-
-    if len(aircraft) > 0:
-        # Check that aircraft are sorted by distance
-        distances = [a.get("distance_km", float("inf")) for a in aircraft]
-        assert distances == sorted(distances), "Aircraft should be sorted by distance"
+# (name, lat, lng) for the hubs and small towns selection is checked against
+LOCATIONS = [
+    ("NYC", 40.7128, -74.0060),
+    ("London", 51.5074, -0.1278),
+    ("Tokyo", 35.6762, 139.6503),
+    ("WestonCT", 41.2220, -73.3690),
+]
 
 
 @pytest.mark.asyncio
-async def test_tokyo_aircraft_selection(tokyo_location):
-    """Test aircraft selection for Tokyo - Asia-Pacific hub"""
-    lat, lng = tokyo_location["lat"], tokyo_location["lng"]
+@pytest.mark.parametrize("name,lat,lng", LOCATIONS)
+async def test_aircraft_selection(name, lat, lng, cached_aircraft):
+    """Test aircraft selection returns up to 3 aircraft, closest first"""
+    aircraft, error = await cached_aircraft(lat, lng)
 
-    aircraft, error = await get_nearby_aircraft(lat, lng, limit=3)
-
-    # Skip if API not configured
-    if "not configured" in error.lower():
-        pytest.skip(f"API not configured: {error}")
-
-    assert error == "", f"Unexpected error: {error}"
+    assert error == "", f"Unexpected error for {name}: {error}"
     assert len(aircraft) <= 3, "Should return max 3 aircraft"
 
+    if len(aircraft) == 0:
+        pytest.skip(f"No aircraft found near {name} at this time")
 
-@pytest.mark.asyncio
-async def test_weston_ct_aircraft_selection(weston_ct_location):
-    """Test aircraft selection for Weston CT - smaller area, may have fewer aircraft"""
-    lat, lng = weston_ct_location["lat"], weston_ct_location["lng"]
-
-    aircraft, error = await get_nearby_aircraft(lat, lng, limit=3)
+    # Verify required fields exist (origin/destination may be unknown for some aircraft)
+    for plane in aircraft:
+        assert "aircraft" in plane, "Missing aircraft type"
+        assert "distance_km" in plane, "Missing distance"
 
-    # Should not error even if no aircraft found
-    assert error == "" or "no aircraft" in error.lower() or len(aircraft) >= 0
+    distances = [a.get("distance_km", float("inf")) for a in aircraft]
+    assert is_sorted(distances), "Aircraft should be sorted by distance"
 
 
 def test_diversity_selection_prefers_different_destinations(sample_aircraft_list):
     """Test that select_diverse_aircraft prioritizes different destinations"""
-    # Add some duplicate destinations
-    aircraft_with_duplicates = sample_aircraft_list + [
+    # Add some duplicate destinations (copies, as selection annotates each aircraft)
+    aircraft_with_duplicates = [dict(aircraft) for aircraft in sample_aircraft_list] + [
         {
             "aircraft": "Boeing 747",
             "origin_city": "Miami",
@@ -98,15 +57,14 @@ def test_diversity_selection_prefers_different_destinations(sample_aircraft_list
     # Check destination diversity
     destinations = [a.get("destination_city") for a in selected if a.get("destination_city")]
     if len(destinations) >= 2:
-        unique_destinations = len(set(destinations))
         # Should prefer diversity (at least 50% unique)
-        assert unique_destinations >= len(destinations) * 0.5, "Should have diverse destinations"
+        assert unique_ratio_at_least(destinations, 0.5), "Should have diverse destinations"
 
 
 def test_diversity_selection_returns_limited_results(sample_aircraft_list):
     """Test that select_diverse_aircraft limits results to 5"""
     # Create list of 10+ aircraft
-    many_aircraft = sample_aircraft_list * 4  # 12 aircraft
+    many_aircraft = [dict(aircraft) for aircraft in sample_aircraft_list * 4]  # 12 aircraft
 
     selected = select_diverse_aircraft(many_aircraft, user_lat=40.0, user_lng=-74.0)
 
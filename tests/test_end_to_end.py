@@ -1,22 +1,27 @@
 """End-to-end tests for complete scanning workflow"""
 
+import sys
+
 import pytest
-from app.main import get_nearby_aircraft
+import pytest_asyncio
 from app.flight_text import generate_flight_text_for_aircraft
+from tests.helpers import OPENING_WORDS, is_sorted, unique_ratio_at_least
+
+
+@pytest_asyncio.fixture(scope="session")
+async def nyc_scan(nyc_location, cached_aircraft):
+    """Run the NYC aircraft lookup once and share (aircraft, error) across tests"""
+    return await cached_aircraft(nyc_location["lat"], nyc_location["lng"])
 
 
 @pytest.mark.asyncio
-async def test_full_scan_flow_nyc(nyc_location):
+async def test_full_scan_flow_nyc(nyc_location, nyc_scan, used_destinations):
     """Test complete scanning flow from NYC location to text generation"""
     lat, lng = nyc_location["lat"], nyc_location["lng"]
     country_code = nyc_location["country_code"]
 
     # Step 1: Get aircraft
-    aircraft, error = await get_nearby_aircraft(lat, lng, limit=3)
-
-    # Skip if API not configured
-    if "not configured" in error.lower():
-        pytest.skip(f"API not configured: {error}")
+    aircraft, error = nyc_scan
 
     # Should not have errors
     assert error == "", f"Aircraft fetch failed: {error}"
@@ -25,7 +30,6 @@ async def test_full_scan_flow_nyc(nyc_location):
         pytest.skip("No aircraft found near NYC at this time")
 
     # Step 2: Generate text for all available planes (up to 3)
-    used_destinations = set()
     results = []
 
     for i, plane in enumerate(aircraft[:3], start=1):
@@ -51,8 +55,7 @@ async def test_full_scan_flow_nyc(nyc_location):
         assert isinstance(result["sentence"], str)
 
         # Check opening phrases
-        opening_words = ["Marvelous!", "Good Heavens!", "Fantastic!", "Splendid!", "What Luck!", "Wow!"]
-        assert any(result["sentence"].startswith(word) for word in opening_words), \
+        assert result["sentence"].startswith(OPENING_WORDS), \
             f"Sentence should start with opening phrase: {result['sentence'][:30]}"
 
         # Check units (imperial for NYC)
@@ -63,17 +66,13 @@ async def test_full_scan_flow_nyc(nyc_location):
 
 
 @pytest.mark.asyncio
-async def test_full_scan_flow_london(london_location):
+async def test_full_scan_flow_london(london_location, used_destinations, cached_aircraft):
     """Test complete scanning flow from London location to text generation"""
     lat, lng = london_location["lat"], london_location["lng"]
     country_code = london_location["country_code"]
 
     # Get aircraft
-    aircraft, error = await get_nearby_aircraft(lat, lng, limit=3)
-
-    # Skip if API not configured
-    if "not configured" in error.lower():
-        pytest.skip(f"API not configured: {error}")
+    aircraft, error = await cached_aircraft(lat, lng)
 
     assert error == ""
 
@@ -81,7 +80,6 @@ async def test_full_scan_flow_london(london_location):
         pytest.skip("No aircraft found near London at this time")
 
     # Generate text for first plane
-    used_destinations = set()
     sentence, fun_fact_source = generate_flight_text_for_aircraft(
         aircraft[0], lat, lng, 1, country_code, used_destinations
     )
@@ -92,22 +90,23 @@ async def test_full_scan_flow_london(london_location):
 
 
 @pytest.mark.asyncio
-async def test_scan_flow_with_duplicate_destinations(nyc_location):
+async def test_scan_flow_with_duplicate_destinations(nyc_location, nyc_scan):
     """Test that duplicate destination handling works in full flow"""
     lat, lng = nyc_location["lat"], nyc_location["lng"]
     country_code = nyc_location["country_code"]
 
     # Get aircraft
-    aircraft, error = await get_nearby_aircraft(lat, lng, limit=3)
+    aircraft, error = nyc_scan
 
     if len(aircraft) < 2:
         pytest.skip("Need at least 2 aircraft for duplicate test")
 
     # Track destinations and fun fact sources
+    planes = aircraft[:3]
     used_destinations = set()
     fun_fact_sources = []
 
-    for i, plane in enumerate(aircraft[:3], start=1):
+    for i, plane in enumerate(planes, start=1):
         sentence, fun_fact_source = generate_flight_text_for_aircraft(
             plane, lat, lng, i, country_code, used_destinations
         )
@@ -117,18 +116,18 @@ async def test_scan_flow_with_duplicate_destinations(nyc_location):
     assert len(used_destinations) > 0, "Should track at least one destination"
 
     # If we have duplicates, at least one should use origin
-    destinations = [a.get("destination_city") for a in aircraft[:3]]
-    if len(destinations) != len(set(destinations)):  # Has duplicates
+    destinations = [a.get("destination_city") for a in planes]
+    if not unique_ratio_at_least(destinations, 1.0):  # Has duplicates
         assert "origin" in fun_fact_sources, "Should use origin for at least one duplicate"
 
 
 @pytest.mark.asyncio
-async def test_scan_handles_no_aircraft_gracefully():
+async def test_scan_handles_no_aircraft_gracefully(cached_aircraft):
     """Test that scanning handles locations with no aircraft gracefully"""
     # Middle of the Atlantic Ocean
     lat, lng = 0.0, -30.0
 
-    aircraft, error = await get_nearby_aircraft(lat, lng, limit=3)
+    aircraft, error = await cached_aircraft(lat, lng)
 
     # Should not crash, either empty list or error message
     assert isinstance(aircraft, list), "Should return list even if empty"
@@ -136,17 +135,16 @@ async def test_scan_handles_no_aircraft_gracefully():
 
 
 @pytest.mark.asyncio
-async def test_three_plane_sequence_maintains_variety(nyc_location):
+async def test_three_plane_sequence_maintains_variety(nyc_location, nyc_scan, used_destinations):
     """Test that generating text for 3 planes maintains variety in opening words"""
     lat, lng = nyc_location["lat"], nyc_location["lng"]
     country_code = nyc_location["country_code"]
 
-    aircraft, error = await get_nearby_aircraft(lat, lng, limit=3)
+    aircraft, error = nyc_scan
 
     if len(aircraft) < 3:
         pytest.skip("Need 3 aircraft for this test")
 
-    used_destinations = set()
     sentences = []
 
     for i, plane in enumerate(aircraft[:3], start=1):
@@ -162,11 +160,11 @@ async def test_three_plane_sequence_maintains_variety(nyc_location):
 
 
 @pytest.mark.asyncio
-async def test_scan_returns_consistent_structure():
+async def test_scan_returns_consistent_structure(cached_aircraft):
     """Test that get_nearby_aircraft always returns consistent structure"""
     lat, lng = 40.7128, -74.0060
 
-    aircraft, error = await get_nearby_aircraft(lat, lng, limit=3)
+    aircraft, error = await cached_aircraft(lat, lng)
 
     # Check return types
     assert isinstance(aircraft, list), "Should return list"
@@ -181,11 +179,9 @@ async def test_scan_returns_consistent_structure():
 
 
 @pytest.mark.asyncio
-async def test_aircraft_sorted_by_distance(nyc_location):
+async def test_aircraft_sorted_by_distance(nyc_scan):
     """Test that returned aircraft are sorted by distance from user"""
-    lat, lng = nyc_location["lat"], nyc_location["lng"]
-
-    aircraft, error = await get_nearby_aircraft(lat, lng, limit=3)
+    aircraft, error = nyc_scan
 
     if len(aircraft) < 2:
         pytest.skip("Need at least 2 aircraft to test sorting")
@@ -194,30 +190,78 @@ async def test_aircraft_sorted_by_distance(nyc_location):
     distances = [a.get("distance_km", float("inf")) for a in aircraft]
 
     # Should be sorted (closest first)
-    assert distances == sorted(distances), f"Aircraft should be sorted by distance, got: {distances}"
-
-
+    assert is_sorted(distances), f"Aircraft should be sorted by distance, got: {distances}"
+
+
+# (lat, lng, country_code, label, place) for the detailed diagnostic output
+DETAILED_OUTPUT_LOCATIONS = [
+    (40.7128, -74.0060, "US", "NYC", "New York City, USA"),
+    (51.5074, -0.1278, "GB", "London", "London, United Kingdom"),
+    (-33.8688, 151.2093, "AU", "Sydney", "Sydney, Australia"),
+    (53.3498, -6.2603, "IE", "Dublin", "Dublin, Ireland"),
+    (34.0522, -118.2437, "US", "Los Angeles", "Los Angeles, USA"),
+    (41.2023, -73.3815, "US", "Weston CT", "Weston, Connecticut, USA"),
+]
+
+
+RULE = "-" * 80
+BANNER = "=" * 80
+
+PLANE_DETAILS_FIELDS = (
+    "aircraft", "airline_name", "flight_number", "origin_city",
+    "origin_country", "destination_city", "destination_country",
+)
+
+PLANE_DETAILS_TEMPLATE = (
+    f"{RULE}\nPLANE {{i}}\n{RULE}\n"
+    "Aircraft Type: {aircraft}\n"
+    "Airline: {airline_name}\n"
+    "Flight Number: {flight_number}\n"
+    "Origin: {origin_city}, {origin_country}\n"
+    "Destination: {destination_city}, {destination_country}\n"
+    "Distance: {distance_km:.1f} km\n"
+    "{kind}\n"
+)
+
+
+def _print_plane_details(i, plane):
+    """Print the provider fields for one selected plane in a single write"""
+    fields = {key: plane.get(key, "Unknown") for key in PLANE_DETAILS_FIELDS}
+    kind = ""
+    if plane.get('is_private_operator'):
+        kind += "Type: Private Jet\n"
+    if plane.get('is_cargo'):
+        kind += "Type: Cargo Flight\n"
+    sys.stdout.write(PLANE_DETAILS_TEMPLATE.format(
+        i=i, distance_km=plane.get('distance_km', 0), kind=kind, **fields
+    ))
+
+
+@pytest.mark.live
+@pytest.mark.detailed
 @pytest.mark.asyncio
-async def test_detailed_output_nyc():
-    """Output detailed information about aircraft selection and text generation for NYC"""
-    lat, lng = 40.7128, -74.0060
-    country_code = "US"
-
-    print("\n" + "="*80)
-    print("DETAILED TEST OUTPUT - NYC Location")
-    print("="*80)
-    print(f"Location: {lat}, {lng} (New York City, USA)")
+@pytest.mark.parametrize(
+    "lat,lng,country_code,label,place",
+    DETAILED_OUTPUT_LOCATIONS,
+    ids=[location[3] for location in DETAILED_OUTPUT_LOCATIONS],
+)
+async def test_detailed_output(lat, lng, country_code, label, place, cached_aircraft):
+    """Output detailed information about aircraft selection and text generation for a location"""
+    print("\n" + BANNER)
+    print(f"DETAILED TEST OUTPUT - {label} Location")
+    print(BANNER)
+    print(f"Location: {lat}, {lng} ({place})")
     print(f"Country Code: {country_code}")
     print()
 
     # Get aircraft
-    aircraft, error = await get_nearby_aircraft(lat, lng, limit=3)
+    aircraft, error = await cached_aircraft(lat, lng)
 
     if error and "not configured" in error.lower():
         pytest.skip(f"API not configured: {error}")
 
     if len(aircraft) == 0:
-        pytest.skip("No aircraft found near NYC at this time")
+        pytest.skip(f"No aircraft found near {label} at this time")
 
     print(f"Total aircraft found: {len(aircraft)}")
     print()
@@ -227,395 +271,7 @@ async def test_detailed_output_nyc():
 
     # Process each plane
     for i, plane in enumerate(aircraft[:3], start=1):
-        print("-" * 80)
-        print(f"PLANE {i}")
-        print("-" * 80)
-
-        # Show aircraft details
-        print(f"Aircraft Type: {plane.get('aircraft', 'Unknown')}")
-        print(f"Airline: {plane.get('airline_name', 'Unknown')}")
-        print(f"Flight Number: {plane.get('flight_number', 'Unknown')}")
-        print(f"Origin: {plane.get('origin_city', 'Unknown')}, {plane.get('origin_country', 'Unknown')}")
-        print(f"Destination: {plane.get('destination_city', 'Unknown')}, {plane.get('destination_country', 'Unknown')}")
-        print(f"Distance: {plane.get('distance_km', 0):.1f} km")
-
-        if plane.get('is_private_operator'):
-            print(f"Type: Private Jet")
-
-        if plane.get('is_cargo'):
-            print(f"Type: Cargo Flight")
-
-        print()
-
-        # Check if destination is duplicate BEFORE generating text
-        is_duplicate = plane.get('destination_city') in used_destinations
-
-        # Generate text
-        sentence, fun_fact_source = generate_flight_text_for_aircraft(
-            plane, lat, lng, i, country_code, used_destinations
-        )
-
-        print(f"Fun Fact Source: {fun_fact_source or 'None'}")
-        if is_duplicate:
-            print(f"Note: Duplicate destination - used origin city fun facts instead")
-        print()
-        print("GENERATED TEXT:")
-        print("-" * 80)
-        print(sentence)
-        print("-" * 80)
-        print()
-
-    print("="*80)
-    print(f"Destinations tracked: {used_destinations}")
-    print("="*80)
-    print()
-
-
-@pytest.mark.asyncio
-async def test_detailed_output_london():
-    """Output detailed information about aircraft selection and text generation for London"""
-    lat, lng = 51.5074, -0.1278
-    country_code = "GB"
-
-    print("\n" + "="*80)
-    print("DETAILED TEST OUTPUT - London Location")
-    print("="*80)
-    print(f"Location: {lat}, {lng} (London, United Kingdom)")
-    print(f"Country Code: {country_code}")
-    print()
-
-    # Get aircraft
-    aircraft, error = await get_nearby_aircraft(lat, lng, limit=3)
-
-    if error and "not configured" in error.lower():
-        pytest.skip(f"API not configured: {error}")
-
-    if len(aircraft) == 0:
-        pytest.skip("No aircraft found near London at this time")
-
-    print(f"Total aircraft found: {len(aircraft)}")
-    print()
-
-    # Track destinations for duplicate detection
-    used_destinations = set()
-
-    # Process each plane
-    for i, plane in enumerate(aircraft[:3], start=1):
-        print("-" * 80)
-        print(f"PLANE {i}")
-        print("-" * 80)
-
-        # Show aircraft details
-        print(f"Aircraft Type: {plane.get('aircraft', 'Unknown')}")
-        print(f"Airline: {plane.get('airline_name', 'Unknown')}")
-        print(f"Flight Number: {plane.get('flight_number', 'Unknown')}")
-        print(f"Origin: {plane.get('origin_city', 'Unknown')}, {plane.get('origin_country', 'Unknown')}")
-        print(f"Destination: {plane.get('destination_city', 'Unknown')}, {plane.get('destination_country', 'Unknown')}")
-        print(f"Distance: {plane.get('distance_km', 0):.1f} km")
-
-        if plane.get('is_private_operator'):
-            print(f"Type: Private Jet")
-
-        if plane.get('is_cargo'):
-            print(f"Type: Cargo Flight")
-
-        print()
-
-        # Check if destination is duplicate BEFORE generating text
-        is_duplicate = plane.get('destination_city') in used_destinations
-
-        # Generate text
-        sentence, fun_fact_source = generate_flight_text_for_aircraft(
-            plane, lat, lng, i, country_code, used_destinations
-        )
-
-        print(f"Fun Fact Source: {fun_fact_source or 'None'}")
-        if is_duplicate:
-            print(f"Note: Duplicate destination - used origin city fun facts instead")
-        print()
-        print("GENERATED TEXT:")
-        print("-" * 80)
-        print(sentence)
-        print("-" * 80)
-        print()
-
-    print("="*80)
-    print(f"Destinations tracked: {used_destinations}")
-    print("="*80)
-    print()
-
-
-@pytest.mark.asyncio
-async def test_detailed_output_sydney():
-    """Output detailed information about aircraft selection and text generation for Sydney"""
-    lat, lng = -33.8688, 151.2093
-    country_code = "AU"
-
-    print("\n" + "="*80)
-    print("DETAILED TEST OUTPUT - Sydney Location")
-    print("="*80)
-    print(f"Location: {lat}, {lng} (Sydney, Australia)")
-    print(f"Country Code: {country_code}")
-    print()
-
-    # Get aircraft
-    aircraft, error = await get_nearby_aircraft(lat, lng, limit=3)
-
-    if error and "not configured" in error.lower():
-        pytest.skip(f"API not configured: {error}")
-
-    if len(aircraft) == 0:
-        pytest.skip("No aircraft found near Sydney at this time")
-
-    print(f"Total aircraft found: {len(aircraft)}")
-    print()
-
-    # Track destinations for duplicate detection
-    used_destinations = set()
-
-    # Process each plane
-    for i, plane in enumerate(aircraft[:3], start=1):
-        print("-" * 80)
-        print(f"PLANE {i}")
-        print("-" * 80)
-
-        # Show aircraft details
-        print(f"Aircraft Type: {plane.get('aircraft', 'Unknown')}")
-        print(f"Airline: {plane.get('airline_name', 'Unknown')}")
-        print(f"Flight Number: {plane.get('flight_number', 'Unknown')}")
-        print(f"Origin: {plane.get('origin_city', 'Unknown')}, {plane.get('origin_country', 'Unknown')}")
-        print(f"Destination: {plane.get('destination_city', 'Unknown')}, {plane.get('destination_country', 'Unknown')}")
-        print(f"Distance: {plane.get('distance_km', 0):.1f} km")
-
-        if plane.get('is_private_operator'):
-            print(f"Type: Private Jet")
-
-        if plane.get('is_cargo'):
-            print(f"Type: Cargo Flight")
-
-        print()
-
-        # Check if destination is duplicate BEFORE generating text
-        is_duplicate = plane.get('destination_city') in used_destinations
-
-        # Generate text
-        sentence, fun_fact_source = generate_flight_text_for_aircraft(
-            plane, lat, lng, i, country_code, used_destinations
-        )
-
-        print(f"Fun Fact Source: {fun_fact_source or 'None'}")
-        if is_duplicate:
-            print(f"Note: Duplicate destination - used origin city fun facts instead")
-        print()
-        print("GENERATED TEXT:")
-        print("-" * 80)
-        print(sentence)
-        print("-" * 80)
-        print()
-
-    print("="*80)
-    print(f"Destinations tracked: {used_destinations}")
-    print("="*80)
-    print()
-
-
-@pytest.mark.asyncio
-async def test_detailed_output_dublin():
-    """Output detailed information about aircraft selection and text generation for Dublin"""
-    lat, lng = 53.3498, -6.2603
-    country_code = "IE"
-
-    print("\n" + "="*80)
-    print("DETAILED TEST OUTPUT - Dublin Location")
-    print("="*80)
-    print(f"Location: {lat}, {lng} (Dublin, Ireland)")
-    print(f"Country Code: {country_code}")
-    print()
-
-    # Get aircraft
-    aircraft, error = await get_nearby_aircraft(lat, lng, limit=3)
-
-    if error and "not configured" in error.lower():
-        pytest.skip(f"API not configured: {error}")
-
-    if len(aircraft) == 0:
-        pytest.skip("No aircraft found near Dublin at this time")
-
-    print(f"Total aircraft found: {len(aircraft)}")
-    print()
-
-    # Track destinations for duplicate detection
-    used_destinations = set()
-
-    # Process each plane
-    for i, plane in enumerate(aircraft[:3], start=1):
-        print("-" * 80)
-        print(f"PLANE {i}")
-        print("-" * 80)
-
-        # Show aircraft details
-        print(f"Aircraft Type: {plane.get('aircraft', 'Unknown')}")
-        print(f"Airline: {plane.get('airline_name', 'Unknown')}")
-        print(f"Flight Number: {plane.get('flight_number', 'Unknown')}")
-        print(f"Origin: {plane.get('origin_city', 'Unknown')}, {plane.get('origin_country', 'Unknown')}")
-        print(f"Destination: {plane.get('destination_city', 'Unknown')}, {plane.get('destination_country', 'Unknown')}")
-        print(f"Distance: {plane.get('distance_km', 0):.1f} km")
-
-        if plane.get('is_private_operator'):
-            print(f"Type: Private Jet")
-
-        if plane.get('is_cargo'):
-            print(f"Type: Cargo Flight")
-
-        print()
-
-        # Check if destination is duplicate BEFORE generating text
-        is_duplicate = plane.get('destination_city') in used_destinations
-
-        # Generate text
-        sentence, fun_fact_source = generate_flight_text_for_aircraft(
-            plane, lat, lng, i, country_code, used_destinations
-        )
-
-        print(f"Fun Fact Source: {fun_fact_source or 'None'}")
-        if is_duplicate:
-            print(f"Note: Duplicate destination - used origin city fun facts instead")
-        print()
-        print("GENERATED TEXT:")
-        print("-" * 80)
-        print(sentence)
-        print("-" * 80)
-        print()
-
-    print("="*80)
-    print(f"Destinations tracked: {used_destinations}")
-    print("="*80)
-    print()
-
-
-@pytest.mark.asyncio
-async def test_detailed_output_los_angeles():
-    """Output detailed information about aircraft selection and text generation for Los Angeles"""
-    lat, lng = 34.0522, -118.2437
-    country_code = "US"
-
-    print("\n" + "="*80)
-    print("DETAILED TEST OUTPUT - Los Angeles Location")
-    print("="*80)
-    print(f"Location: {lat}, {lng} (Los Angeles, USA)")
-    print(f"Country Code: {country_code}")
-    print()
-
-    # Get aircraft
-    aircraft, error = await get_nearby_aircraft(lat, lng, limit=3)
-
-    if error and "not configured" in error.lower():
-        pytest.skip(f"API not configured: {error}")
-
-    if len(aircraft) == 0:
-        pytest.skip("No aircraft found near Los Angeles at this time")
-
-    print(f"Total aircraft found: {len(aircraft)}")
-    print()
-
-    # Track destinations for duplicate detection
-    used_destinations = set()
-
-    # Process each plane
-    for i, plane in enumerate(aircraft[:3], start=1):
-        print("-" * 80)
-        print(f"PLANE {i}")
-        print("-" * 80)
-
-        # Show aircraft details
-        print(f"Aircraft Type: {plane.get('aircraft', 'Unknown')}")
-        print(f"Airline: {plane.get('airline_name', 'Unknown')}")
-        print(f"Flight Number: {plane.get('flight_number', 'Unknown')}")
-        print(f"Origin: {plane.get('origin_city', 'Unknown')}, {plane.get('origin_country', 'Unknown')}")
-        print(f"Destination: {plane.get('destination_city', 'Unknown')}, {plane.get('destination_country', 'Unknown')}")
-        print(f"Distance: {plane.get('distance_km', 0):.1f} km")
-
-        if plane.get('is_private_operator'):
-            print(f"Type: Private Jet")
-
-        if plane.get('is_cargo'):
-            print(f"Type: Cargo Flight")
-
-        print()
-
-        # Check if destination is duplicate BEFORE generating text
-        is_duplicate = plane.get('destination_city') in used_destinations
-
-        # Generate text
-        sentence, fun_fact_source = generate_flight_text_for_aircraft(
-            plane, lat, lng, i, country_code, used_destinations
-        )
-
-        print(f"Fun Fact Source: {fun_fact_source or 'None'}")
-        if is_duplicate:
-            print(f"Note: Duplicate destination - used origin city fun facts instead")
-        print()
-        print("GENERATED TEXT:")
-        print("-" * 80)
-        print(sentence)
-        print("-" * 80)
-        print()
-
-    print("="*80)
-    print(f"Destinations tracked: {used_destinations}")
-    print("="*80)
-    print()
-
-
-@pytest.mark.asyncio
-async def test_detailed_output_weston_ct():
-    """Output detailed information about aircraft selection and text generation for Weston CT"""
-    lat, lng = 41.2023, -73.3815
-    country_code = "US"
-
-    print("\n" + "="*80)
-    print("DETAILED TEST OUTPUT - Weston CT Location")
-    print("="*80)
-    print(f"Location: {lat}, {lng} (Weston, Connecticut, USA)")
-    print(f"Country Code: {country_code}")
-    print()
-
-    # Get aircraft
-    aircraft, error = await get_nearby_aircraft(lat, lng, limit=3)
-
-    if error and "not configured" in error.lower():
-        pytest.skip(f"API not configured: {error}")
-
-    if len(aircraft) == 0:
-        pytest.skip("No aircraft found near Weston CT at this time")
-
-    print(f"Total aircraft found: {len(aircraft)}")
-    print()
-
-    # Track destinations for duplicate detection
-    used_destinations = set()
-
-    # Process each plane
-    for i, plane in enumerate(aircraft[:3], start=1):
-        print("-" * 80)
-        print(f"PLANE {i}")
-        print("-" * 80)
-
-        # Show aircraft details
-        print(f"Aircraft Type: {plane.get('aircraft', 'Unknown')}")
-        print(f"Airline: {plane.get('airline_name', 'Unknown')}")
-        print(f"Flight Number: {plane.get('flight_number', 'Unknown')}")
-        print(f"Origin: {plane.get('origin_city', 'Unknown')}, {plane.get('origin_country', 'Unknown')}")
-        print(f"Destination: {plane.get('destination_city', 'Unknown')}, {plane.get('destination_country', 'Unknown')}")
-        print(f"Distance: {plane.get('distance_km', 0):.1f} km")
-
-        if plane.get('is_private_operator'):
-            print(f"Type: Private Jet")
-
-        if plane.get('is_cargo'):
-            print(f"Type: Cargo Flight")
-
-        print()
+        _print_plane_details(i, plane)
 
         # Check if destination is duplicate BEFORE generating text
         is_duplicate = plane.get('destination_city') in used_destinations
@@ -630,12 +286,12 @@ async def test_detailed_output_weston_ct():
             print(f"Note: Duplicate destination - used origin city fun facts instead")
         print()
         print("GENERATED TEXT:")
-        print("-" * 80)
+        print(RULE)
         print(sentence)
-        print("-" * 80)
+        print(RULE)
         print()
 
-    print("="*80)
+    print(BANNER)
     print(f"Destinations tracked: {used_destinations}")
-    print("="*80)
+    print(BANNER)
     print()
@@ -1,86 +1,52 @@
 """Endpoint tests using FastAPI TestClient to catch runtime errors"""
 
+import asyncio
+import re
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
-
-
-class TestFreeEndpoints:
-    """Tests for free tier endpoints"""
-
-    def test_free_scanning_endpoint_no_500(self, client):
-        """Test /free/scanning doesn't return 500 error"""
-        response = client.get("/free/scanning")
-        # Should return 200 (success) or 429 (rate limited), not 500
-        assert response.status_code != 500, f"Server error: {response.text}"
-
-    def test_free_scanning_again_endpoint_no_500(self, client):
-        """Test /free/scanning-again doesn't return 500 error"""
-        response = client.get("/free/scanning-again")
-        assert response.status_code != 500, f"Server error: {response.text}"
-
-    def test_free_overandout_endpoint_no_500(self, client):
-        """Test /free/overandout doesn't return 500 error"""
-        response = client.get("/free/overandout")
-        assert response.status_code != 500, f"Server error: {response.text}"
-
-    def test_free_plane_1_endpoint_no_500(self, client):
-        """Test /free/plane/1 doesn't return 500 error"""
-        response = client.get("/free/plane/1")
-        # May return 200 (audio), 404 (no pool), or 429 (rate limited)
-        # Should never return 500
-        assert response.status_code != 500, f"Server error: {response.text}"
-
-    def test_free_plane_2_endpoint_no_500(self, client):
-        """Test /free/plane/2 doesn't return 500 error"""
-        response = client.get("/free/plane/2")
-        assert response.status_code != 500, f"Server error: {response.text}"
-
-    def test_free_plane_3_endpoint_no_500(self, client):
-        """Test /free/plane/3 doesn't return 500 error"""
-        response = client.get("/free/plane/3")
-        assert response.status_code != 500, f"Server error: {response.text}"
-
-
-class TestPremiumEndpoints:
-    """Tests for premium endpoints"""
-
-    def test_scanning_mp3_endpoint_no_500(self, client):
-        """Test /scanning.mp3 doesn't return 500 error"""
-        response = client.get("/scanning.mp3")
-        assert response.status_code != 500, f"Server error: {response.text}"
-
-    def test_intro_mp3_endpoint_no_500(self, client):
-        """Test /intro.mp3 doesn't return 500 error"""
-        response = client.get("/intro.mp3")
-        assert response.status_code != 500, f"Server error: {response.text}"
-
-    def test_scanning_again_mp3_endpoint_no_500(self, client):
-        """Test /scanning-again.mp3 doesn't return 500 error"""
-        response = client.get("/scanning-again.mp3")
-        assert response.status_code != 500, f"Server error: {response.text}"
-
-    def test_overandout_mp3_endpoint_no_500(self, client):
-        """Test /overandout.mp3 doesn't return 500 error"""
-        response = client.get("/overandout.mp3")
-        assert response.status_code != 500, f"Server error: {response.text}"
-
-
-    def test_plane_4_endpoint_no_500(self, client):
-        """Test /plane/4 doesn't return 500 error"""
-        response = client.get("/plane/4")
-        assert response.status_code != 500, f"Server error: {response.text}"
-
-    def test_plane_5_endpoint_no_500(self, client):
-        """Test /plane/5 doesn't return 500 error"""
-        response = client.get("/plane/5")
-        assert response.status_code != 500, f"Server error: {response.text}"
+    """Create one test client for the FastAPI app, running its lifespan once"""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+# Audio endpoints may answer 200, 404 (no pool) or 429 (rate limited) but
+# should never return 500
+AUDIO_ENDPOINTS = (
+    "/free/scanning",
+    "/free/scanning-again",
+    "/free/overandout",
+    "/free/plane/1",
+    "/free/plane/2",
+    "/free/plane/3",
+    "/scanning.mp3",
+    "/intro.mp3",
+    "/scanning-again.mp3",
+    "/overandout.mp3",
+    "/plane/4",
+    "/plane/5",
+)
+
+
+@pytest.mark.asyncio
+async def test_audio_endpoints_no_500():
+    """Test no free or premium audio endpoint returns a 500 error"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        responses = await asyncio.gather(*(async_client.get(url) for url in AUDIO_ENDPOINTS))
+
+    server_errors = {
+        url: response.text
+        for url, response in zip(AUDIO_ENDPOINTS, responses)
+        if response.status_code == 500
+    }
+    assert not server_errors, f"Server errors: {server_errors}"
 
 
 class TestHealthEndpoints:
@@ -90,3 +56,75 @@ class TestHealthEndpoints:
         """Test root endpoint returns 200"""
         response = client.get("/")
         assert response.status_code == 200
+
+    def test_root_endpoint_serves_precompressed_html(self, client):
+        """Test root endpoint picks brotli/gzip from Accept-Encoding"""
+        response = client.get("/", headers={"Accept-Encoding": "gzip, br"})
+        assert response.headers["content-encoding"] == "br"
+        assert "Dreaming of a Jet Plane" in response.text
+
+        response = client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+
+        response = client.get("/", headers={"Accept-Encoding": "br;q=0.5, gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+
+        response = client.get("/", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.headers["vary"] == "Accept-Encoding"
+
+    def test_root_endpoint_not_modified(self, client):
+        """Test root endpoint returns 304 when the ETag matches"""
+        etag = client.get("/").headers["etag"]
+        response = client.get("/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_home_page_assets_are_fingerprinted(self, client):
+        """Test the home page links its CSS/JS by content hash with immutable caching"""
+        html = client.get("/").text
+        urls = re.findall(r'(?:href|src)="(/assets/(?:css|js)/home\.[0-9a-f]+\.(?:css|js))"', html)
+        assert len(urls) == 2
+        for url in urls:
+            response = client.get(url)
+            assert response.status_code == 200
+            assert "immutable" in response.headers["cache-control"]
+        assert "<style>" not in html
+
+    def test_static_assets_are_cacheable(self, client):
+        """Test images under /assets carry a long-lived Cache-Control header"""
+        response = client.get("/assets/img/icon.png")
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, max-age=86400"
+
+    def test_yoto_playlists_revalidate(self, client):
+        """Test editable Yoto playlists are not cached without revalidation"""
+        response = client.get("/assets/yoto-playlists/dreaming-of-a-jet-plane.json")
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "no-cache"
+        assert "etag" in response.headers
+
+    def test_bot_probes_get_bare_404(self, client):
+        """Test common scanner paths are rejected before routing"""
+        for path in ("/wp-login.php", "/.env", "/.git/config"):
+            response = client.get(path)
+            assert response.status_code == 404
+            assert response.content == b""
+            assert response.headers["cache-control"] == "public, max-age=3600"
+
+    def test_robots_and_sitemap_not_modified(self, client):
+        """Test robots.txt and sitemap.xml revalidate with their ETags"""
+        for path in ("/robots.txt", "/sitemap.xml"):
+            etag = client.get(path).headers["etag"]
+            response = client.get(path, headers={"If-None-Match": etag})
+            assert response.status_code == 304
+
+    def test_robots_and_sitemap_if_modified_since(self, client):
+        """Test robots.txt and sitemap.xml honour If-Modified-Since"""
+        for path in ("/robots.txt", "/sitemap.xml"):
+            last_modified = client.get(path).headers["last-modified"]
+            response = client.get(path, headers={"If-Modified-Since": last_modified})
+            assert response.status_code == 304
+
+            response = client.get(path, headers={"If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"})
+            assert response.status_code == 200
@@ -2,6 +2,15 @@
 
 import pytest
 from app.flight_text import generate_flight_text_for_aircraft, generate_flight_text
+from tests.helpers import OPENING_WORDS
+
+
+@pytest.fixture(scope="module")
+def plane1_us_result(sample_aircraft):
+    """(sentence, fun_fact_source) for plane 1 near New York, generated once for the module"""
+    return generate_flight_text_for_aircraft(
+        sample_aircraft, 40.0, -74.0, plane_index=1, country_code="US"
+    )
 
 
 def test_text_generation_imperial_units(sample_aircraft):
@@ -49,41 +58,32 @@ def test_text_generation_japanese_metric(sample_aircraft):
     assert "kilometers" in sentence or "kilometres" in sentence, "Should use kilometers for JP"
 
 
-def test_text_includes_aircraft_name(sample_aircraft):
+def test_text_includes_aircraft_name(plane1_us_result):
     """Test that generated text includes aircraft name with digits as words"""
-    sentence, _ = generate_flight_text_for_aircraft(
-        sample_aircraft, 40.0, -74.0, plane_index=1, country_code="US"
-    )
+    sentence, _ = plane1_us_result
 
     # Boeing 737 should become "Boeing seven three seven"
     assert "Boeing seven three seven" in sentence, "Should spell out aircraft number digits as words"
 
 
-def test_text_includes_origin_and_destination(sample_aircraft):
+def test_text_includes_origin_and_destination(plane1_us_result):
     """Test that text mentions origin and destination cities"""
-    sentence, _ = generate_flight_text_for_aircraft(
-        sample_aircraft, 40.0, -74.0, plane_index=1, country_code="US"
-    )
+    sentence, _ = plane1_us_result
 
     assert "Boston" in sentence, "Should mention origin city"
     assert "New York" in sentence, "Should mention destination city"
 
 
-def test_text_has_opening_phrase(sample_aircraft):
+def test_text_has_opening_phrase(plane1_us_result):
     """Test that text starts with one of the expected opening phrases"""
-    sentence, _ = generate_flight_text_for_aircraft(
-        sample_aircraft, 40.0, -74.0, plane_index=1, country_code="US"
-    )
+    sentence, _ = plane1_us_result
 
-    opening_words = ["Marvelous!", "Good Heavens!", "Fantastic!", "Splendid!", "What Luck!", "Wow!", "Remarkable!", "Tremendous!", "Brilliant!", "By Jove!"]
-    assert any(sentence.startswith(word) for word in opening_words), f"Should start with opening phrase, got: {sentence[:20]}"
+    assert sentence.startswith(OPENING_WORDS), f"Should start with opening phrase, got: {sentence[:20]}"
 
 
-def test_text_no_closing_prompt_plane1(sample_aircraft):
+def test_text_no_closing_prompt_plane1(plane1_us_result):
     """Test that plane 1 has no closing prompt (moved to static audio files)"""
-    sentence, _ = generate_flight_text_for_aircraft(
-        sample_aircraft, 40.0, -74.0, plane_index=1, country_code="US"
-    )
+    sentence, _ = plane1_us_result
 
     assert "Should we find another" not in sentence, "Plane 1 should not have closing prompt (moved to static audio)"
     assert "Let's find one more" not in sentence, "Plane 1 should not have closing prompt"
@@ -115,8 +115,7 @@ def test_text_plane4_opening(sample_aircraft):
         sample_aircraft, 40.0, -74.0, plane_index=4, country_code="US"
     )
 
-    opening_words = ["Marvelous!", "Good Heavens!", "Fantastic!", "Splendid!", "What Luck!", "Wow!", "Remarkable!", "Tremendous!", "Brilliant!", "By Jove!"]
-    assert any(sentence.startswith(word) for word in opening_words), f"Should start with opening phrase, got: {sentence[:20]}"
+    assert sentence.startswith(OPENING_WORDS), f"Should start with opening phrase, got: {sentence[:20]}"
     assert "yet another jet plane" in sentence, "Plane 4 should mention 'yet another'"
 
 
@@ -126,16 +125,13 @@ def test_text_plane5_opening(sample_aircraft):
         sample_aircraft, 40.0, -74.0, plane_index=5, country_code="US"
     )
 
-    opening_words = ["Marvelous!", "Good Heavens!", "Fantastic!", "Splendid!", "What Luck!", "Wow!", "Remarkable!", "Tremendous!", "Brilliant!", "By Jove!"]
-    assert any(sentence.startswith(word) for word in opening_words), f"Should start with opening phrase, got: {sentence[:20]}"
+    assert sentence.startswith(OPENING_WORDS), f"Should start with opening phrase, got: {sentence[:20]}"
     assert "one final jet plane" in sentence, "Plane 5 should mention 'one final'"
 
 
-def test_fun_fact_source_is_tracked(sample_aircraft):
+def test_fun_fact_source_is_tracked(plane1_us_result):
     """Test that fun_fact_source is returned"""
-    sentence, fun_fact_source = generate_flight_text_for_aircraft(
-        sample_aircraft, 40.0, -74.0, plane_index=1, country_code="US"
-    )
+    sentence, fun_fact_source = plane1_us_result
 
     # fun_fact_source should be "destination", "origin", or None
     assert fun_fact_source in ("destination", "origin", None), f"Invalid fun_fact_source: {fun_fact_source}"
@@ -164,121 +160,68 @@ def test_private_jet_text():
     assert "flight N 1 2 3 A B" not in sentence, "Should not spell out tail number"
 
 
-def test_error_message_generation():
-    """Test generate_flight_text with no aircraft (error case)"""
+def _user_location(city, region, country_name):
+    """generate_flight_text keyword arguments for the user's geolocated place"""
+    return {"user_city": city, "user_region": region, "user_country_name": country_name}
+
+
+# (error_message, user location kwargs, substrings the friendly message must contain,
+# whether to match them case-insensitively).
+# The location cases fall back city -> region -> country -> generic.
+ERROR_MESSAGE_CASES = [
+    pytest.param("No aircraft providers configured", {}, ["sorry"], True, id="no-providers"),
+    pytest.param("Request timed out", {}, ["took too long"], False, id="timeout"),
+    pytest.param("API key not configured", {}, ["acting all silly"], False, id="api-key"),
+    pytest.param("API returned HTTP 500", {}, ["tracking module"], False, id="http-error"),
+    pytest.param("Network connection error", {}, ["connection"], True, id="connection"),
+    pytest.param(
+        "no passenger aircraft found",
+        _user_location("New York", "New York", "United States"),
+        ["celestial quadrant above New York"],
+        False,
+        id="city",
+    ),
+    pytest.param(
+        "no passenger aircraft found",
+        _user_location("", "Connecticut", "United States"),
+        ["celestial quadrant above Connecticut"],
+        False,
+        id="region-fallback",
+    ),
+    pytest.param(
+        "no passenger aircraft found",
+        _user_location("", "", "United States"),
+        ["celestial quadrant above United States"],
+        False,
+        id="country-fallback",
+    ),
+    pytest.param(
+        "no passenger aircraft found",
+        _user_location("", "", ""),
+        ["in this celestial quadrant"],
+        False,
+        id="generic",
+    ),
+]
+
+
+@pytest.mark.parametrize("error_message,location,expected,ignore_case", ERROR_MESSAGE_CASES)
+def test_error_message(error_message, location, expected, ignore_case):
+    """Test each error type produces its friendly message, naming the most specific place known"""
     sentence = generate_flight_text(
-        [],
-        error_message="No aircraft providers configured",
-        user_lat=40.0,
-        user_lng=-74.0,
-        country_code="US"
+        [], error_message=error_message, user_lat=40.0, user_lng=-74.0, country_code="US", **location
     )
 
-    # Should return a friendly error message
     assert isinstance(sentence, str)
-    assert len(sentence) > 0
-    assert "sorry" in sentence.lower()
+    haystack = sentence.lower() if ignore_case else sentence
+    for substring in expected:
+        needle = substring.lower() if ignore_case else substring
+        assert needle in haystack, f"Expected {substring!r} in: {sentence}"
 
 
-def test_error_message_includes_city():
-    """Test that error message includes city when available"""
-    sentence = generate_flight_text(
-        [],
-        error_message="no passenger aircraft found",
-        user_lat=40.0,
-        user_lng=-74.0,
-        country_code="US",
-        user_city="New York",
-        user_region="New York",
-        user_country_name="United States"
-    )
-
-    assert "New York" in sentence, "Error message should include city name"
-    assert "celestial quadrant above New York" in sentence
-
-
-def test_error_message_falls_back_to_region():
-    """Test that error message falls back to region when city is empty"""
-    sentence = generate_flight_text(
-        [],
-        error_message="no passenger aircraft found",
-        user_lat=40.0,
-        user_lng=-74.0,
-        country_code="US",
-        user_city="",
-        user_region="Connecticut",
-        user_country_name="United States"
-    )
-
-    assert "Connecticut" in sentence, "Error message should fall back to region"
-    assert "celestial quadrant above Connecticut" in sentence
-
-
-def test_error_message_falls_back_to_country():
-    """Test that error message falls back to country when city and region are empty"""
-    sentence = generate_flight_text(
-        [],
-        error_message="no passenger aircraft found",
-        user_lat=40.0,
-        user_lng=-74.0,
-        country_code="US",
-        user_city="",
-        user_region="",
-        user_country_name="United States"
-    )
-
-    assert "United States" in sentence, "Error message should fall back to country"
-    assert "celestial quadrant above United States" in sentence
-
-
-def test_error_message_generic_when_no_location():
-    """Test that error message is generic when no location data available"""
-    sentence = generate_flight_text(
-        [],
-        error_message="no passenger aircraft found",
-        user_lat=40.0,
-        user_lng=-74.0,
-        country_code="US",
-        user_city="",
-        user_region="",
-        user_country_name=""
-    )
-
-    assert "in this celestial quadrant" in sentence, "Error message should be generic without location"
-
-
-def test_differentiated_error_messages():
-    """Test that different error types produce different friendly messages"""
-    # Timeout error
-    timeout_sentence = generate_flight_text(
-        [], error_message="Request timed out", user_lat=40.0, user_lng=-74.0, country_code="US"
-    )
-    assert "took too long" in timeout_sentence, "Timeout should mention taking too long"
-
-    # API key error
-    api_key_sentence = generate_flight_text(
-        [], error_message="API key not configured", user_lat=40.0, user_lng=-74.0, country_code="US"
-    )
-    assert "acting all silly" in api_key_sentence, "API key error should say scanner is silly"
-
-    # HTTP error
-    http_sentence = generate_flight_text(
-        [], error_message="API returned HTTP 500", user_lat=40.0, user_lng=-74.0, country_code="US"
-    )
-    assert "tracking module" in http_sentence, "HTTP error should mention tracking module"
-
-    # Connection error
-    conn_sentence = generate_flight_text(
-        [], error_message="Network connection error", user_lat=40.0, user_lng=-74.0, country_code="US"
-    )
-    assert "connection" in conn_sentence.lower(), "Connection error should mention connection"
-
-
-def test_text_generation_returns_tuple(sample_aircraft):
+def test_text_generation_returns_tuple(plane1_us_result):
     """Test that generate_flight_text_for_aircraft returns a tuple"""
-    result = generate_flight_text_for_aircraft(
-        sample_aircraft, 40.0, -74.0, plane_index=1, country_code="US"
-    )
+    result = plane1_us_result
 
     assert isinstance(result, tuple), "Should return tuple"
     assert len(result) == 2, "Should return 2-element tuple (sentence, fun_fact_source)"